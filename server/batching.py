@@ -0,0 +1,148 @@
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+
+from server.executor import (
+    InferenceExecutor,
+    InferenceOverloadedError
+)
+
+from src.model_impl.base import ModelPredictionDataclassProtocol
+
+
+@dataclass(frozen=True)
+class BatchingStats:
+    batches: int
+    items: int
+    mean_batch_size: float
+    max_batch_size: int
+    batch_size_histogram: dict[int, int]
+
+
+class PredictionBatcher:
+    """Coalesces concurrent single-text predictions into vectorized batches"""
+
+
+    def __init__(
+        self,
+        executor: InferenceExecutor,
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_queue_size: int = 0
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_queue_size = max_queue_size
+
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._dispatches: set[asyncio.Task] = set()
+        self._batch_sizes: Counter[int] = Counter()
+
+    async def predict(self, text: str) -> ModelPredictionDataclassProtocol:
+        self._ensure_started()
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((text, future))
+        except asyncio.QueueFull:
+            raise InferenceOverloadedError(
+                f"Batching queue is full ({self.max_queue_size} waiting texts)"
+            ) from None
+
+        return await future
+
+    async def close(self) -> None:
+        if self._worker is None:
+            return
+
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+
+        self._worker = None
+        self._queue = None
+
+    @property
+    def stats(self) -> BatchingStats:
+        batches = sum(self._batch_sizes.values())
+        items = sum(size * count for size, count in self._batch_sizes.items())
+
+        return BatchingStats(
+            batches=batches,
+            items=items,
+            mean_batch_size=items / batches if batches else 0.0,
+            max_batch_size=max(self._batch_sizes, default=0),
+            batch_size_histogram=dict(sorted(self._batch_sizes.items()))
+        )
+
+    def _ensure_started(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._slots = asyncio.Semaphore(self.executor.max_pending)
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _collect_batch(self) -> list[tuple[str, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            # Wait for room in the executor first, so texts queue here and only a full queue answers 503
+            await self._slots.acquire()
+
+            batch = await self._collect_batch()
+            batch = [(text, future) for text, future in batch if not future.done()]
+
+            if not batch:
+                self._slots.release()
+                continue
+
+            self._batch_sizes[len(batch)] += 1
+
+            dispatch = asyncio.get_running_loop().create_task(self._dispatch(batch))
+            self._dispatches.add(dispatch)
+            dispatch.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        try:
+            predictions = await self.executor.predict_many([text for text, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        finally:
+            self._slots.release()
+
+        for (_, future), prediction in zip(batch, predictions):
+            if not future.done():
+                future.set_result(prediction)
@@ -0,0 +1,33 @@
+import secrets
+
+from fastapi import (
+    Header,
+    HTTPException,
+    Request
+)
+
+from server.registry import ModelRegistry
+
+from src.config.config import config
+
+
+def get_registry(request: Request) -> ModelRegistry:
+    registry: ModelRegistry | None = getattr(request.app.state, "registry", None)
+
+    if registry is None or not registry.ready:
+        raise HTTPException(
+            status_code=503,
+            detail="Model is not loaded yet",
+            headers={"Retry-After": "1"}
+        )
+
+    return registry
+
+
+def require_admin(x_admin_token: str | None = Header(None)) -> None:
+    # Admin endpoints stay disabled until a token is configured
+    if config.server.ADMIN_TOKEN is None:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled")
+
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, config.server.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
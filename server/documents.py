@@ -0,0 +1,73 @@
+import asyncio
+import codecs
+from collections.abc import AsyncIterator
+
+from server.inference import InferenceService
+
+from src.model_impl.document import (
+    DocumentPrediction,
+    DocumentSegmenter,
+    Segment,
+    SegmentPrediction,
+    aggregate_segments
+)
+
+
+class DocumentTooLargeError(Exception):
+    pass
+
+
+async def classify_document_stream(
+    inference: InferenceService,
+    chunks: AsyncIterator[bytes],
+    max_bytes: int,
+    batch_size: int
+) -> tuple[DocumentPrediction, int]:
+    """Segments a UTF-8 body as it arrives and scores one batch of windows while the next is read"""
+    segmenter = DocumentSegmenter()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+
+    predictions: list[SegmentPrediction] = []
+    pending: list[Segment] = []
+    scoring: asyncio.Task | None = None
+    received = 0
+    length = 0
+
+    async def score(segments: list[Segment]) -> None:
+        # Windows are rarely repeated, and a large document would evict every cached single-text answer
+        batch = await inference.predict_many([segment.text for segment in segments], use_cache=False)
+        predictions.extend(
+            SegmentPrediction(start=segment.start, end=segment.end, probability_ai=prediction.probability_ai)
+            for segment, prediction in zip(segments, batch)
+        )
+
+    try:
+        async for chunk in chunks:
+            received += len(chunk)
+            if received > max_bytes:
+                raise DocumentTooLargeError(f"Document exceeds {max_bytes} bytes")
+
+            text = decoder.decode(chunk)
+            length += len(text)
+            pending += segmenter.feed(text)
+
+            while len(pending) >= batch_size:
+                # At most one batch in flight, so a fast upload cannot outrun the model
+                if scoring is not None:
+                    await scoring
+                scoring = asyncio.create_task(score(pending[:batch_size]))
+                pending = pending[batch_size:]
+
+        text = decoder.decode(b"", final=True)
+        length += len(text)
+        pending += segmenter.feed(text) + segmenter.close()
+
+        if scoring is not None:
+            await scoring
+        if pending:
+            await score(pending)
+    finally:
+        if scoring is not None and not scoring.done():
+            scoring.cancel()
+
+    return aggregate_segments(predictions), length
@@ -0,0 +1,152 @@
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ThreadPoolExecutor,
+    ProcessPoolExecutor
+)
+from pathlib import Path
+from typing import (
+    Callable,
+    Literal
+)
+
+from server.metrics import (
+    PREDICT_BATCH_SIZE,
+    PREDICT_STAGE_SECONDS
+)
+
+from src.model_impl.base import ModelPredictionDataclassProtocol
+from src.model_impl.cache import model_fingerprint
+from src.model_impl.worker import (
+    load_worker_model,
+    worker_model
+)
+from src.model_impl.wrapper import ModelWrapper
+
+
+class InferenceOverloadedError(Exception):
+    pass
+
+
+class InferenceExecutor:
+    """Runs CPU-bound model inference off the event loop with a bounded backlog"""
+
+
+    def __init__(
+        self,
+        pool: Executor,
+        task: Callable[[list[str]], tuple[list[ModelPredictionDataclassProtocol], dict[str, float]]],
+        max_pending: int,
+        fingerprint: str,
+        model_name: str
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        self.max_pending = max_pending
+        self.fingerprint = fingerprint
+        self.model_name = model_name
+
+        self._pool = pool
+        self._task = task
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def predict_many(self, texts: list[str]) -> list[ModelPredictionDataclassProtocol]:
+        if self._pending >= self.max_pending:
+            raise InferenceOverloadedError(
+                f"Inference backlog is full ({self.max_pending} pending tasks)"
+            )
+
+        self._pending += 1
+        try:
+            predictions, timings = await asyncio.get_running_loop().run_in_executor(
+                self._pool, self._task, texts
+            )
+        finally:
+            self._pending -= 1
+
+        PREDICT_BATCH_SIZE.observe(len(texts), model=self.model_name)
+        for stage, seconds in timings.items():
+            PREDICT_STAGE_SECONDS.observe(seconds, model=self.model_name, stage=stage)
+
+        return predictions
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+class ThreadInferenceExecutor(InferenceExecutor):
+    """Shares one loaded model between the threads of the pool"""
+
+
+    def __init__(
+        self,
+        model_path: Path,
+        model_name: str,
+        max_workers: int,
+        max_pending: int,
+        compiled: bool = False
+    ) -> None:
+        self.model = ModelWrapper()
+        if compiled:
+            self.model.load_compiled(model_path)
+        else:
+            self.model.load(model_path)
+
+        super().__init__(
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inference"),
+            self.model.predict_many_timed,
+            max_pending,
+            self.model.fingerprint,
+            model_name
+        )
+
+
+def _predict_many_in_worker(texts: list[str]) -> tuple[list[ModelPredictionDataclassProtocol], dict[str, float]]:
+    # Stage timings travel back with the predictions, since metrics live in the server process
+    return worker_model().predict_many_timed(texts)
+
+
+class ProcessInferenceExecutor(InferenceExecutor):
+    """Loads the model once per worker process and routes batches to them"""
+
+
+    def __init__(
+        self,
+        model_path: Path,
+        model_name: str,
+        max_workers: int,
+        max_pending: int,
+        compiled: bool = False
+    ) -> None:
+        super().__init__(
+            ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=load_worker_model,
+                initargs=(model_path, compiled)
+            ),
+            _predict_many_in_worker,
+            max_pending,
+            model_fingerprint(model_path),
+            model_name
+        )
+
+
+def create_inference_executor(
+    mode: Literal["thread", "process"],
+    model_path: Path,
+    model_name: str,
+    max_workers: int,
+    max_pending: int,
+    compiled: bool = False
+) -> InferenceExecutor:
+    if mode == "thread":
+        return ThreadInferenceExecutor(model_path, model_name, max_workers, max_pending, compiled)
+    if mode == "process":
+        return ProcessInferenceExecutor(model_path, model_name, max_workers, max_pending, compiled)
+
+    raise ValueError(f"Unknown inference executor mode: {mode!r}")
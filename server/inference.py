@@ -0,0 +1,124 @@
+import asyncio
+from pathlib import Path
+
+from server.batching import PredictionBatcher
+from server.executor import (
+    InferenceExecutor,
+    create_inference_executor
+)
+
+from src.config.config import config
+from src.model_impl.base import ModelPredictionDataclassProtocol
+from src.model_impl.cache import PredictionCache
+
+# Representative inputs near the 300-350 char training distribution
+WARMUP_TEXTS = (
+    "Honestly I didn't expect the trip to go this way. We missed the first train, the cafe was "
+    "closed, and my sister kept arguing with the map app! Still, by the evening we found a tiny "
+    "place near the river that served the best soup I've had in years. Would I do it again? "
+    "Probably, but with a better plan.",
+    "Artificial intelligence has significantly transformed various industries, including "
+    "healthcare, finance, and education. By leveraging advanced algorithms and large datasets, "
+    "these systems can identify patterns, automate processes, and provide valuable insights. "
+    "However, it is essential to address ethical considerations to ensure responsible adoption.",
+    "The results, in short: three of the five samples failed; the other two passed (barely). "
+    "Nobody on the team could explain why. We re-ran everything on Monday [same settings, same "
+    "machine] and got the exact same numbers - so it isn't noise. Next step is checking the "
+    "calibration logs from last week, I guess.",
+)
+
+
+class InferenceService:
+    """Prediction cache in front of the batcher and the inference executor"""
+
+
+    def __init__(
+        self,
+        executor: InferenceExecutor,
+        batcher: PredictionBatcher,
+        cache: PredictionCache | None = None
+    ) -> None:
+        self.executor = executor
+        self.batcher = batcher
+        self.cache = cache
+
+    async def predict(self, text: str) -> ModelPredictionDataclassProtocol:
+        fingerprint = self.executor.fingerprint
+
+        if self.cache is not None:
+            prediction = self.cache.get(text, fingerprint)
+            if prediction is not None:
+                return prediction
+
+        prediction = await self.batcher.predict(text)
+
+        if self.cache is not None:
+            self.cache.put(text, fingerprint, prediction)
+
+        return prediction
+
+    async def predict_many(self, texts: list[str], use_cache: bool = True) -> list[ModelPredictionDataclassProtocol]:
+        if self.cache is None or not use_cache:
+            return await self.executor.predict_many(texts)
+
+        fingerprint = self.executor.fingerprint
+        predictions: dict[str, ModelPredictionDataclassProtocol] = {}
+        missing: list[str] = []
+
+        for text in dict.fromkeys(texts):
+            prediction = self.cache.get(text, fingerprint)
+            if prediction is None:
+                missing.append(text)
+            else:
+                predictions[text] = prediction
+
+        if missing:
+            for text, prediction in zip(missing, await self.executor.predict_many(missing)):
+                self.cache.put(text, fingerprint, prediction)
+                predictions[text] = prediction
+
+        return [predictions[text] for text in texts]
+
+    async def warm_up(self, rounds: int) -> None:
+        # One batch per worker and round, so every pool worker pays its cold-start cost now;
+        # never more at once than the executor accepts, or warm-up itself would be rejected
+        concurrency = min(config.server.EXECUTOR_WORKERS, self.executor.max_pending)
+        for _ in range(rounds):
+            await asyncio.gather(*(
+                self.executor.predict_many(list(WARMUP_TEXTS))
+                for _ in range(concurrency)
+            ))
+
+    async def close(self) -> None:
+        await self.batcher.close()
+        # Waiting for the pool blocks, so it must not happen on the event loop
+        await asyncio.to_thread(self.executor.shutdown)
+
+        # A closed service is a retired or shut down model; its entries can never be hit again
+        if self.cache is not None:
+            self.cache.invalidate()
+
+
+def create_inference_service(model_path: Path, model_name: str) -> InferenceService:
+    executor = create_inference_executor(
+        config.server.EXECUTOR_MODE,
+        model_path,
+        model_name,
+        max_workers=config.server.EXECUTOR_WORKERS,
+        max_pending=config.server.EXECUTOR_MAX_PENDING,
+        compiled=config.server.COMPILED_INFERENCE
+    )
+
+    batcher = PredictionBatcher(
+        executor,
+        max_batch_size=config.server.MAX_BATCH_SIZE,
+        max_wait_ms=config.server.MAX_BATCH_WAIT_MS,
+        max_queue_size=config.server.MAX_QUEUE_SIZE
+    )
+
+    cache = PredictionCache(
+        max_entries=config.server.CACHE_MAX_ENTRIES,
+        ttl_seconds=config.server.CACHE_TTL_SECONDS or None
+    ) if config.server.CACHE_MAX_ENTRIES > 0 else None
+
+    return InferenceService(executor, batcher, cache=cache)
@@ -1,3 +1,12 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from fastapi.responses import (
+    JSONResponse,
+    Response
+)
 from fastapi.templating import Jinja2Templates
 
 from fastapi import (
@@ -5,12 +14,106 @@ from fastapi import (
     Request
 )
 
+from server.executor import InferenceOverloadedError
+from server.metrics import (
+    CONTENT_TYPE,
+    REGISTRY,
+    REQUESTS_TOTAL,
+    REQUEST_DURATION_SECONDS,
+    text_length_range
+)
+from server.registry import (
+    ModelNotLoadedError,
+    ModelRegistry,
+    UnknownModelError,
+    discover_model_paths
+)
 from server.routers import api_router
 
-app = FastAPI()
+from src.config.config import config
+from src.training.model_configs import MODEL_CONFIGS
+
+logger = logging.getLogger(__name__)
+
+
+def create_model_registry() -> ModelRegistry:
+    names = config.server.MODELS or [model_config.name for model_config in MODEL_CONFIGS]
+    model_paths = discover_model_paths(config.server.MODELS_DIR, names)
+
+    # MODEL_PATH is always served, under its file name, as the default model
+    default_model = config.server.MODEL_PATH.stem
+    model_paths[default_model] = config.server.MODEL_PATH
+
+    return ModelRegistry(model_paths, default_model, warmup_rounds=config.server.WARMUP_ROUNDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.registry = create_model_registry()
+
+    # Load in the background so liveness/readiness answer while the models are loading
+    loading = asyncio.create_task(app.state.registry.load_all())
+
+    yield
+
+    if not loading.done():
+        loading.cancel()
+        try:
+            await loading
+        except asyncio.CancelledError:
+            pass
+
+    await app.state.registry.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(api_router)
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Label by the matched endpoint, not the raw path, to keep label cardinality bounded
+        route = request.scope.get("route")
+        handler = route.name if route is not None else "unmatched"
+
+        REQUESTS_TOTAL.inc(handler=handler, method=request.method, status=str(status))
+        REQUEST_DURATION_SECONDS.observe(
+            time.perf_counter() - start,
+            handler=handler,
+            text_length=text_length_range(getattr(request.state, "text_length", None))
+        )
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
+
+@app.exception_handler(InferenceOverloadedError)
+async def inference_overloaded_handler(request: Request, exc: InferenceOverloadedError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"}
+    )
+
+@app.exception_handler(UnknownModelError)
+async def unknown_model_handler(request: Request, exc: UnknownModelError):
+    return JSONResponse(status_code=404, content={"detail": str(exc)})
+
+@app.exception_handler(ModelNotLoadedError)
+async def model_not_loaded_handler(request: Request, exc: ModelNotLoadedError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"}
+    )
+
 jinja_templates = Jinja2Templates(directory="server/templates")
 
 @app.get("/")
@@ -0,0 +1,168 @@
+import math
+import threading
+from bisect import bisect_left
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+TEXT_LENGTH_BUCKETS = (100, 300, 500, 1000, 2000, 5000)
+
+# Request latency is split by these text length ranges (chars, upper bound inclusive)
+TEXT_LENGTH_RANGES = (100, 1000, 5000)
+
+
+def text_length_range(length: int | None) -> str:
+    if length is None:
+        return "none"
+
+    for upper in TEXT_LENGTH_RANGES:
+        if length <= upper:
+            return f"le_{upper}"
+
+    return f"gt_{TEXT_LENGTH_RANGES[-1]}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: tuple[str, ...], labelvalues: tuple[str, ...], extra: str = "") -> str:
+    pairs = [
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(labelnames, labelvalues)
+    ]
+    if extra:
+        pairs.append(extra)
+
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonic counter in the Prometheus text exposition format"""
+
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus text exposition format"""
+
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+        # Per label set: [per-bucket counts..., sum]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = bisect_left(self.buckets, value)
+
+        with self._lock:
+            counts = self._values.setdefault(key, [0.0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            counts[-1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, counts in sorted(self._values.items()):
+                cumulative = 0.0
+                for upper, count in zip(self.buckets, counts):
+                    cumulative += count
+                    labels = _format_labels(self.labelnames, key, f'le="{_format_value(upper)}"')
+                    lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(counts[-1])}")
+                lines.append(f"{self.name}_count{labels} {_format_value(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: list[Counter | Histogram] = []
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(line for metric in self._metrics for line in metric.render()) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+REQUESTS_TOTAL = REGISTRY.counter(
+    "classifier_http_requests_total",
+    "HTTP requests by handler, method and status code.",
+    ("handler", "method", "status")
+)
+REQUEST_DURATION_SECONDS = REGISTRY.histogram(
+    "classifier_http_request_duration_seconds",
+    "HTTP request latency by handler and longest input text length range.",
+    ("handler", "text_length")
+)
+TEXT_LENGTH_CHARS = REGISTRY.histogram(
+    "classifier_text_length_chars",
+    "Length of classified texts in characters.",
+    ("handler",),
+    buckets=TEXT_LENGTH_BUCKETS
+)
+PREDICT_STAGE_SECONDS = REGISTRY.histogram(
+    "classifier_predict_stage_seconds",
+    "Time spent per inference batch in each model stage.",
+    ("model", "stage")
+)
+PREDICT_BATCH_SIZE = REGISTRY.histogram(
+    "classifier_predict_batch_size",
+    "Number of texts per model inference call.",
+    ("model",),
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1000)
+)
@@ -0,0 +1,229 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import (
+    dataclass,
+    field
+)
+from pathlib import Path
+
+from server.inference import (
+    InferenceService,
+    create_inference_service
+)
+from src.model_impl.artifact import MANIFEST_FILE
+
+logger = logging.getLogger(__name__)
+
+
+class UnknownModelError(Exception):
+    pass
+
+class ModelNotLoadedError(Exception):
+    pass
+
+
+@dataclass
+class ModelEntry:
+    name: str
+    path: Path
+    service: InferenceService
+    in_flight: int = 0
+    retired: bool = False
+    drained: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+@dataclass(frozen=True)
+class ModelStatus:
+    name: str
+    path: str
+    loaded: bool
+    fingerprint: str | None
+    in_flight: int
+    reloading: bool
+    error: str | None
+
+
+def _saved_at(path: Path) -> int | None:
+    # An artifact's manifest is written last, so its mtime is when the export finished
+    file = path / MANIFEST_FILE if path.suffix == ".artifact" else path
+    return file.stat().st_mtime_ns if file.is_file() else None
+
+
+def newest_model_file(models_dir: Path, name: str) -> Path | None:
+    """The most recently saved of a model's artifact directory and pickle; the artifact wins a tie"""
+    candidates = [
+        path for path in (models_dir / f"{name}.artifact", models_dir / f"{name}.pkl")
+        if _saved_at(path) is not None
+    ]
+    if not candidates:
+        return None
+
+    # Training only writes the pickle, so an artifact older than it was exported from a previous version
+    path = max(candidates, key=_saved_at)
+    if len(candidates) > 1:
+        logger.info("Model %s: using %s, the newest of %s", name, path.name, ", ".join(c.name for c in candidates))
+
+    return path
+
+
+def discover_model_paths(models_dir: Path, names: list[str]) -> dict[str, Path]:
+    """Maps every model name with a saved file to its newest artifact directory or pickle"""
+    paths = {}
+    for name in names:
+        path = newest_model_file(models_dir, name)
+        if path is not None:
+            paths[name] = path
+
+    return paths
+
+
+class ModelRegistry:
+    """Named inference services that are swapped atomically and drained before they are closed"""
+
+
+    def __init__(self, model_paths: dict[str, Path], default_model: str, warmup_rounds: int = 0) -> None:
+        if default_model not in model_paths:
+            raise ValueError(f"Default model {default_model!r} has no saved file")
+
+        self.default_model = default_model
+        self.warmup_rounds = warmup_rounds
+
+        self._paths = dict(model_paths)
+        self._entries: dict[str, ModelEntry] = {}
+        self._reloads: dict[str, asyncio.Task] = {}
+        self._errors: dict[str, str] = {}
+        # Replaced versions still draining; close() must free them if their reload task is cancelled
+        self._retiring: list[ModelEntry] = []
+
+    @property
+    def ready(self) -> bool:
+        return self.default_model in self._entries
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._paths)
+
+    def error(self, name: str) -> str | None:
+        return self._errors.get(name)
+
+    def status(self) -> list[ModelStatus]:
+        statuses = []
+        for name, path in self._paths.items():
+            entry = self._entries.get(name)
+            reload = self._reloads.get(name)
+
+            statuses.append(ModelStatus(
+                name=name,
+                path=str(path),
+                loaded=entry is not None,
+                fingerprint=entry.service.executor.fingerprint if entry is not None else None,
+                in_flight=entry.in_flight if entry is not None else 0,
+                reloading=reload is not None and not reload.done(),
+                error=self._errors.get(name)
+            ))
+
+        return statuses
+
+    def service(self, name: str | None = None) -> InferenceService:
+        return self._entry(name).service
+
+    @asynccontextmanager
+    async def lease(self, name: str | None = None) -> AsyncIterator[InferenceService]:
+        """Pins the current service of a model for one request, so a reload waits for it to finish"""
+        entry = self._entry(name)
+
+        entry.in_flight += 1
+        try:
+            yield entry.service
+        finally:
+            entry.in_flight -= 1
+            if entry.retired and entry.in_flight == 0:
+                entry.drained.set()
+
+    async def load_all(self) -> None:
+        # The default model first, so the server turns ready as early as possible
+        names = [self.default_model] + [name for name in self._paths if name != self.default_model]
+
+        for name in names:
+            await self._reload(name)
+
+    def reload(self, name: str) -> asyncio.Task:
+        """Starts a background reload of one model; a reload already in progress is reused"""
+        if name not in self._paths:
+            raise UnknownModelError(f"Unknown model: {name!r}")
+
+        task = self._reloads.get(name)
+        if task is None or task.done():
+            task = asyncio.create_task(self._reload(name))
+            self._reloads[name] = task
+
+        return task
+
+    async def close(self) -> None:
+        for task in self._reloads.values():
+            task.cancel()
+        await asyncio.gather(*self._reloads.values(), return_exceptions=True)
+
+        entries = list(self._entries.values()) + self._retiring
+        self._entries.clear()
+        self._retiring.clear()
+        for entry in entries:
+            await entry.service.close()
+
+    def _entry(self, name: str | None) -> ModelEntry:
+        name = name or self.default_model
+
+        entry = self._entries.get(name)
+        if entry is not None:
+            return entry
+
+        if name in self._paths:
+            raise ModelNotLoadedError(f"Model {name!r} is not loaded yet")
+        raise UnknownModelError(f"Unknown model: {name!r}")
+
+    async def _reload(self, name: str) -> None:
+        # Picks up a model retrained or re-exported since the last load
+        path = newest_model_file(self._paths[name].parent, self._paths[name].stem) or self._paths[name]
+        self._paths[name] = path
+
+        # A failed reload keeps serving the previous version of the model
+        try:
+            service = await asyncio.to_thread(create_inference_service, path, name)
+        except Exception as exc:
+            self._record_error(name, path, exc)
+            return
+
+        try:
+            await service.warm_up(self.warmup_rounds)
+        except BaseException as exc:
+            await service.close()
+            if not isinstance(exc, Exception):
+                raise
+            self._record_error(name, path, exc)
+            return
+
+        self._errors.pop(name, None)
+
+        previous = self._entries.get(name)
+        self._entries[name] = ModelEntry(name=name, path=path, service=service)
+        logger.info("Model %s loaded from %s", name, path)
+
+        if previous is not None:
+            await self._retire(previous)
+
+    def _record_error(self, name: str, path: Path, exc: Exception) -> None:
+        logger.error("Failed to load model %s from %s", name, path, exc_info=exc)
+        self._errors[name] = f"{type(exc).__name__}: {exc}"
+
+    async def _retire(self, entry: ModelEntry) -> None:
+        entry.retired = True
+        if entry.in_flight == 0:
+            entry.drained.set()
+
+        self._retiring.append(entry)
+        await entry.drained.wait()
+        await entry.service.close()
+        self._retiring.remove(entry)
+        logger.info("Previous version of model %s drained and closed", entry.name)
@@ -1,9 +1,13 @@
 from fastapi import APIRouter
 
 from .classifier import router as classifier_router
+from .health import router as health_router
+from .models import router as models_router
 
 api_router = APIRouter()
 api_router.include_router(classifier_router, prefix="/api/v1", tags=["classifier"])
+api_router.include_router(health_router, prefix="/api/v1", tags=["health"])
+api_router.include_router(models_router, prefix="/api/v1", tags=["models"])
 
 
 __all__ = ["api_router"]
\ No newline at end of file
@@ -1,28 +1,143 @@
-from pathlib import Path
-
-from fastapi import APIRouter
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Request
+)
 
 from server.schemas.classifier import (
     ClassificationIn, 
-    ClassificationOut
+    ClassificationOut,
+    ClassificationBatchIn,
+    ClassificationBatchOut,
+    DocumentClassificationOut,
+    SegmentOut,
+    BatchingStatsOut,
+    CacheStatsOut,
+    StatsOut
 )
 
-from src.model_impl.wrapper import ModelWrapper
-
-model = ModelWrapper()
-model.load(
-    Path("src") / "models" / "wcmsl_more_words_finetuned.pkl"
+from server.dependencies import get_registry
+from server.documents import (
+    DocumentTooLargeError,
+    classify_document_stream
 )
+from server.metrics import TEXT_LENGTH_CHARS
+from server.registry import ModelRegistry
+
+from src.config.config import config
+from src.model_impl.document import EmptyDocumentError
 
 router = APIRouter()
 
 @router.post("/classify")
-async def classify_text(payload: ClassificationIn) -> ClassificationOut:
+async def classify_text(
+    payload: ClassificationIn,
+    request: Request,
+    registry: ModelRegistry = Depends(get_registry)
+) -> ClassificationOut:
     text = payload.text
-    prediction = model.predict(text)
+
+    request.state.text_length = len(text)
+    TEXT_LENGTH_CHARS.observe(len(text), handler="classify_text")
+
+    async with registry.lease(payload.model) as inference:
+        prediction = await inference.predict(text)
 
     return ClassificationOut(
         result=prediction.result,
         probability_ai=prediction.probability_ai,
         probability_human=prediction.probability_human
     )
+
+
+@router.post("/classify/batch")
+async def classify_texts(
+    payload: ClassificationBatchIn,
+    request: Request,
+    registry: ModelRegistry = Depends(get_registry)
+) -> ClassificationBatchOut:
+    request.state.text_length = max(len(text) for text in payload.texts)
+    for text in payload.texts:
+        TEXT_LENGTH_CHARS.observe(len(text), handler="classify_texts")
+
+    async with registry.lease(payload.model) as inference:
+        predictions = await inference.predict_many(payload.texts)
+
+    return ClassificationBatchOut(
+        results=[
+            ClassificationOut(
+                result=prediction.result,
+                probability_ai=prediction.probability_ai,
+                probability_human=prediction.probability_human
+            )
+            for prediction in predictions
+        ]
+    )
+
+
+@router.post(
+    "/classify/document",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"text/plain": {"schema": {"type": "string"}}}
+        }
+    }
+)
+async def classify_document(
+    request: Request,
+    model: str | None = None,
+    registry: ModelRegistry = Depends(get_registry)
+) -> DocumentClassificationOut:
+    content_length = request.headers.get("content-length")
+    if content_length is not None:
+        try:
+            declared_bytes = int(content_length)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Content-Length header")
+
+        if declared_bytes > config.server.MAX_DOCUMENT_BYTES:
+            raise HTTPException(status_code=413, detail=f"Document exceeds {config.server.MAX_DOCUMENT_BYTES} bytes")
+
+    async with registry.lease(model) as inference:
+        try:
+            prediction, length = await classify_document_stream(
+                inference,
+                request.stream(),
+                max_bytes=config.server.MAX_DOCUMENT_BYTES,
+                batch_size=config.document.BATCH_SIZE
+            )
+        except DocumentTooLargeError as exc:
+            raise HTTPException(status_code=413, detail=str(exc))
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=400, detail="Document is not valid UTF-8")
+        except EmptyDocumentError as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+
+    request.state.text_length = length
+    TEXT_LENGTH_CHARS.observe(length, handler="classify_document")
+
+    return DocumentClassificationOut(
+        result=prediction.result,
+        probability_ai=prediction.probability_ai,
+        probability_human=prediction.probability_human,
+        length=length,
+        segments=[
+            SegmentOut(start=segment.start, end=segment.end, probability_ai=segment.probability_ai)
+            for segment in prediction.segments
+        ]
+    )
+
+
+@router.get("/stats")
+async def get_stats(model: str | None = None, registry: ModelRegistry = Depends(get_registry)) -> StatsOut:
+    inference = registry.service(model)
+
+    return StatsOut(
+        batching=BatchingStatsOut(**vars(inference.batcher.stats)),
+        cache=CacheStatsOut(
+            **vars(inference.cache.stats),
+            hit_ratio=inference.cache.stats.hit_ratio
+        ) if inference.cache is not None else None
+    )
@@ -0,0 +1,30 @@
+from fastapi import (
+    APIRouter,
+    Request,
+    Response
+)
+
+from server.schemas.health import (
+    LivenessOut,
+    ReadinessOut
+)
+
+router = APIRouter()
+
+@router.get("/health/live")
+async def liveness() -> LivenessOut:
+    return LivenessOut(status="ok")
+
+
+@router.get("/health/ready")
+async def readiness(request: Request, response: Response) -> ReadinessOut:
+    registry = getattr(request.app.state, "registry", None)
+    ready = registry is not None and registry.ready
+
+    if not ready:
+        response.status_code = 503
+
+    return ReadinessOut(
+        ready=ready,
+        error=registry.error(registry.default_model) if registry is not None else None
+    )
@@ -0,0 +1,33 @@
+from dataclasses import asdict
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Request
+)
+
+from server.dependencies import require_admin
+from server.schemas.models import (
+    ModelListOut,
+    ModelReloadOut,
+    ModelStatusOut
+)
+
+router = APIRouter()
+
+@router.get("/models")
+async def list_models(request: Request) -> ModelListOut:
+    registry = request.app.state.registry
+
+    return ModelListOut(
+        default=registry.default_model,
+        models=[ModelStatusOut(**asdict(status)) for status in registry.status()]
+    )
+
+
+@router.post("/admin/models/{name}/reload", status_code=202, dependencies=[Depends(require_admin)])
+async def reload_model(name: str, request: Request) -> ModelReloadOut:
+    # The new version loads in the background and replaces the old one only once it is warmed up
+    request.app.state.registry.reload(name)
+
+    return ModelReloadOut(name=name, reloading=True)
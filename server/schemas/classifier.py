@@ -1,10 +1,16 @@
-from typing import Literal
+from typing import (
+    Annotated,
+    Literal
+)
 
 from pydantic import (
     BaseModel,
-    Field
+    Field,
+    StringConstraints
 )
 
+ClassificationText = Annotated[str, StringConstraints(min_length=1, max_length=5000)]
+
 class ClassificationIn(BaseModel):
     text: str = Field(
         ...,
@@ -15,6 +21,13 @@ class ClassificationIn(BaseModel):
             "example": "This is a sample text to classify."
         }
     )
+    model: str | None = Field(
+        None,
+        description="Name of the model to classify with; the server default when omitted.",
+        json_schema_extra={
+            "example": "wcmsl_more_words"
+        }
+    )
 
 class ClassificationOut(BaseModel):
     result: Literal["HUMAN", "AI"] = Field(
@@ -41,4 +54,71 @@ class ClassificationOut(BaseModel):
         json_schema_extra={
             "example": 0.15
         }
-    )
\ No newline at end of file
+    )
+
+class ClassificationBatchIn(BaseModel):
+    texts: list[ClassificationText] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="The texts to be classified in a single batch.",
+        json_schema_extra={
+            "example": [
+                "This is a sample text to classify.",
+                "This is another sample text to classify."
+            ]
+        }
+    )
+    model: str | None = Field(
+        None,
+        description="Name of the model to classify with; the server default when omitted.",
+        json_schema_extra={
+            "example": "wcmsl_more_words"
+        }
+    )
+
+class ClassificationBatchOut(BaseModel):
+    results: list[ClassificationOut] = Field(
+        ...,
+        description="The classification results in the same order as the input texts."
+    )
+
+class SegmentOut(BaseModel):
+    start: int = Field(..., description="Offset of the first char of the segment in the document.")
+    end: int = Field(..., description="Offset one past the last char of the segment in the document.")
+    probability_ai: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="The probability that the segment is generated by AI."
+    )
+
+class DocumentClassificationOut(ClassificationOut):
+    length: int = Field(..., description="The document length in characters.")
+    segments: list[SegmentOut] = Field(
+        ...,
+        description="The overlapping windows the document was scored in, in document order."
+    )
+
+class BatchingStatsOut(BaseModel):
+    batches: int = Field(..., description="Number of coalesced batches sent to the model.")
+    items: int = Field(..., description="Number of texts classified through the batcher.")
+    mean_batch_size: float = Field(..., description="Average number of texts per batch.")
+    max_batch_size: int = Field(..., description="Largest batch sent to the model.")
+    batch_size_histogram: dict[int, int] = Field(
+        ...,
+        description="Number of batches observed for every batch size."
+    )
+
+class CacheStatsOut(BaseModel):
+    entries: int = Field(..., description="Number of cached predictions.")
+    max_entries: int = Field(..., description="Capacity of the prediction cache.")
+    hits: int = Field(..., description="Lookups answered from the cache.")
+    misses: int = Field(..., description="Lookups that required model inference.")
+    evictions: int = Field(..., description="Entries dropped to stay within capacity.")
+    expirations: int = Field(..., description="Entries dropped because their TTL elapsed.")
+    hit_ratio: float = Field(..., description="Share of lookups answered from the cache.")
+
+class StatsOut(BaseModel):
+    batching: BatchingStatsOut
+    cache: CacheStatsOut | None = None
\ No newline at end of file
@@ -0,0 +1,22 @@
+from typing import Literal
+
+from pydantic import (
+    BaseModel,
+    Field
+)
+
+class LivenessOut(BaseModel):
+    status: Literal["ok"] = Field(
+        ...,
+        description="Always 'ok' while the process is serving requests."
+    )
+
+class ReadinessOut(BaseModel):
+    ready: bool = Field(
+        ...,
+        description="Whether the default model is loaded and warmed up."
+    )
+    error: str | None = Field(
+        None,
+        description="The default model loading error, if its last load failed."
+    )
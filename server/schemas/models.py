@@ -0,0 +1,21 @@
+from pydantic import (
+    BaseModel,
+    Field
+)
+
+class ModelStatusOut(BaseModel):
+    name: str = Field(..., description="The model name, as passed in the 'model' field of a request.")
+    path: str = Field(..., description="The file the model is loaded from.")
+    loaded: bool = Field(..., description="Whether a version of the model is serving requests.")
+    fingerprint: str | None = Field(None, description="Fingerprint of the serving version of the model.")
+    in_flight: int = Field(..., description="Requests currently using the serving version.")
+    reloading: bool = Field(..., description="Whether a background reload is in progress.")
+    error: str | None = Field(None, description="The last loading error, if the last load failed.")
+
+class ModelListOut(BaseModel):
+    default: str = Field(..., description="The model used when a request names none.")
+    models: list[ModelStatusOut]
+
+class ModelReloadOut(BaseModel):
+    name: str = Field(..., description="The model being reloaded.")
+    reloading: bool = Field(..., description="Always true; poll the model list for the outcome.")
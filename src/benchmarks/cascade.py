@@ -0,0 +1,127 @@
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+from sklearn.metrics import (
+    accuracy_score,
+    f1_score
+)
+from sklearn.model_selection import train_test_split
+
+from src.benchmarks.training import git_commit
+from src.model_impl.cascade import CascadeModel
+from src.model_impl.wrapper import ModelWrapper
+from src.utils.dataset import load_dataset
+
+CHEAP_MODEL = "ms_base"
+HEAVY_MODELS = ("wcl_base", "wcmsl_more_words_finetuned")
+UNCERTAINTY_BANDS = ((0.3, 0.7), (0.1, 0.9), (0.05, 0.95), (0.01, 0.99), (0.001, 0.999))
+
+BATCH_SIZE = 64
+SINGLE_REQUESTS = 500
+
+
+def held_out_split(dataset_path: Path) -> tuple[list[str], np.ndarray]:
+    # Same split as BaseModelMixin.train, so none of these texts were seen in training
+    df = load_dataset(dataset_path)
+    _, X_test, _, y_test = train_test_split(
+        df["text"],
+        df["generated"],
+        test_size=0.25,
+        random_state=42,
+        stratify=df["generated"]
+    )
+
+    return X_test.tolist(), y_test.to_numpy()
+
+
+def load_model(path: Path) -> ModelWrapper:
+    model = ModelWrapper()
+    model.load(path)
+    return model
+
+
+def evaluate(model: ModelWrapper | CascadeModel, texts: list[str], labels: np.ndarray) -> dict:
+    model.predict_many(texts[:BATCH_SIZE])
+    # The warm-up batch is scored again below and must not count twice towards the escalation rate
+    if isinstance(model, CascadeModel):
+        model.reset_stats()
+
+    probabilities = []
+    batch_latencies = []
+    start = time.perf_counter()
+    for i in range(0, len(texts), BATCH_SIZE):
+        batch_start = time.perf_counter()
+        probabilities += [prediction.probability_ai for prediction in model.predict_many(texts[i:i + BATCH_SIZE])]
+        batch_latencies.append((time.perf_counter() - batch_start) * 1000)
+    elapsed = time.perf_counter() - start
+
+    # Read before the single-text pass, which goes through the same counters
+    escalation_rate = model.stats().escalation_rate if isinstance(model, CascadeModel) else None
+
+    single_latencies = []
+    for text in texts[:SINGLE_REQUESTS]:
+        request_start = time.perf_counter()
+        model.predict(text)
+        single_latencies.append((time.perf_counter() - request_start) * 1000)
+
+    y_pred = (np.asarray(probabilities) >= 0.5).astype(int)
+
+    return {
+        "accuracy": float(accuracy_score(labels, y_pred)),
+        "f1": float(f1_score(labels, y_pred)),
+        "escalation_rate": escalation_rate,
+        "batch_ms_per_text": elapsed * 1000 / len(texts),
+        "batch_p95_ms": float(np.percentile(batch_latencies, 95)),
+        "single_p50_ms": float(np.percentile(single_latencies, 50)),
+        "single_p95_ms": float(np.percentile(single_latencies, 95)),
+    }
+
+
+def benchmark_cascades(texts: list[str], labels: np.ndarray, models_dir: Path) -> list[dict]:
+    cheap = load_model(models_dir / f"{CHEAP_MODEL}.pkl")
+    results = [{"cheap": CHEAP_MODEL, "heavy": None, "band": None, **evaluate(cheap, texts, labels)}]
+
+    for heavy_name in HEAVY_MODELS:
+        heavy = load_model(models_dir / f"{heavy_name}.pkl")
+        results.append({"cheap": None, "heavy": heavy_name, "band": None, **evaluate(heavy, texts, labels)})
+
+        for band in UNCERTAINTY_BANDS:
+            cascade = CascadeModel(cheap, heavy, uncertainty_band=band)
+            results.append({"cheap": CHEAP_MODEL, "heavy": heavy_name, "band": list(band), **evaluate(cascade, texts, labels)})
+
+    return results
+
+
+def main():
+    dataset_path = Path("data") / "raw" / "Test_AI_Human.csv"
+    models_dir = Path("src") / "models"
+    output_path = Path("data") / "benchmarks" / "cascade.json"
+
+    texts, labels = held_out_split(dataset_path)
+    results = benchmark_cascades(texts, labels, models_dir)
+
+    for result in results:
+        name = " -> ".join(model for model in (result["cheap"], result["heavy"]) if model)
+        band = str(tuple(result["band"])) if result["band"] else "-"
+        escalation = f"{result['escalation_rate']:6.1%}" if result["escalation_rate"] is not None else "     -"
+        print(
+            f"{name:<38}{band:<16}escalated={escalation}  acc={result['accuracy']:.4f}  f1={result['f1']:.4f}  "
+            f"batch={result['batch_ms_per_text']:.3f}ms/text  single p50={result['single_p50_ms']:.2f}ms  "
+            f"p95={result['single_p95_ms']:.2f}ms"
+        )
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps({
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "n_texts": len(texts),
+        "results": results,
+    }, indent=2))
+    print(f"Results written to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
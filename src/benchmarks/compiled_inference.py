@@ -0,0 +1,71 @@
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from src.model_impl.wrapper import ModelWrapper
+from src.benchmarks.synthetic import generate_texts
+
+
+def latencies_ms(predict, texts: list[str]) -> list[float]:
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        predict(text)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def load_measuring_memory(model_path: Path, compiled: bool) -> tuple[ModelWrapper, float]:
+    tracemalloc.start()
+
+    model = ModelWrapper()
+    if compiled:
+        model.load_compiled(model_path)
+    else:
+        model.load(model_path)
+
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return model, retained / 2**20
+
+
+def main():
+    models_dir = Path("src") / "models"
+    texts = generate_texts(300)
+
+    print(
+        f"{'model':<28}{'sklearn p50':>12}{'compiled p50':>14}{'speedup':>9}"
+        f"{'sklearn MB':>12}{'compiled MB':>13}{'max |dp|':>11}"
+    )
+
+    for model_path in sorted(models_dir.glob("*.pkl")):
+        artifact_path = model_path.with_suffix(".artifact")
+        compiled_source = artifact_path if artifact_path.is_dir() else model_path
+
+        model, sklearn_mb = load_measuring_memory(model_path, compiled=False)
+        sklearn_probabilities = np.array([p.probability_ai for p in model.predict_many(texts)])
+        sklearn_latencies = latencies_ms(model.predict, texts)
+        del model
+
+        model, compiled_mb = load_measuring_memory(compiled_source, compiled=True)
+        compiled_probabilities = np.array([p.probability_ai for p in model.predict_many(texts)])
+        compiled_latencies = latencies_ms(model.predict, texts)
+        del model
+
+        sklearn_p50 = statistics.median(sklearn_latencies)
+        compiled_p50 = statistics.median(compiled_latencies)
+
+        print(
+            f"{model_path.stem:<28}{sklearn_p50:>10.3f}ms{compiled_p50:>12.3f}ms"
+            f"{sklearn_p50 / compiled_p50:>8.1f}x"
+            f"{sklearn_mb:>12.1f}{compiled_mb:>13.1f}"
+            f"{np.abs(sklearn_probabilities - compiled_probabilities).max():>11.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import statistics
+import subprocess
+import sys
+
+# Seconds, median of fresh interpreter imports; sklearn/pandas dominate both
+IMPORT_TIME_BUDGETS = {
+    "src.model_impl": 3.0,
+    "server.main": 3.0,
+}
+
+REPEATS = 5
+
+
+def measure_import_time(module: str) -> float:
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - start)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    over_budget = []
+
+    for module, budget in IMPORT_TIME_BUDGETS.items():
+        median = statistics.median(measure_import_time(module) for _ in range(REPEATS))
+        status = "ok" if median <= budget else "OVER BUDGET"
+        print(f"{module:<20}{median:8.3f}s  (budget {budget:.1f}s)  {status}")
+
+        if median > budget:
+            over_budget.append(module)
+
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+from server.main import app
+from server.registry import ModelRegistry
+from src.benchmarks.synthetic import generate_text
+from src.benchmarks.training import git_commit
+from src.model_impl.wrapper import ModelWrapper
+
+# ClassificationIn accepts 1-5000 characters
+LENGTH_BUCKETS = ((1, 100), (100, 1000), (1000, 5000))
+CONCURRENCY_LEVELS = (1, 8, 32)
+
+DIRECT_REQUESTS = 200
+HTTP_REQUESTS = 400
+
+
+def latency_summary(latencies_ms: list[float], elapsed_seconds: float) -> dict:
+    p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+
+    return {
+        "requests": len(latencies_ms),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "rps": len(latencies_ms) / elapsed_seconds,
+    }
+
+
+def generate_bucket_texts(n: int, bucket: tuple[int, int], seed: int) -> list[str]:
+    # Distinct texts per request, so the prediction cache never turns the benchmark into a lookup test
+    rng = random.Random(seed)
+    return [generate_text(rng, *bucket) for _ in range(n)]
+
+
+def benchmark_direct(model: ModelWrapper, texts: list[str]) -> dict:
+    latencies = []
+
+    start = time.perf_counter()
+    for text in texts:
+        request_start = time.perf_counter()
+        model.predict(text)
+        latencies.append((time.perf_counter() - request_start) * 1000)
+
+    return latency_summary(latencies, time.perf_counter() - start)
+
+
+async def benchmark_http(client: httpx.AsyncClient, texts: list[str], concurrency: int) -> dict:
+    latencies = []
+    queue = iter(texts)
+
+    async def worker():
+        for text in queue:
+            request_start = time.perf_counter()
+            response = await client.post("/api/v1/classify", json={"text": text})
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - request_start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return latency_summary(latencies, time.perf_counter() - start)
+
+
+async def benchmark_model_http(model_path: Path) -> list[dict]:
+    # The in-process app gets a single-model registry directly instead of through the lifespan hook
+    app.state.registry = ModelRegistry({model_path.stem: model_path}, model_path.stem, warmup_rounds=1)
+    await app.state.registry.load_all()
+    if not app.state.registry.ready:
+        raise RuntimeError(app.state.registry.error(model_path.stem))
+
+    results = []
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            for i, bucket in enumerate(LENGTH_BUCKETS):
+                for concurrency in CONCURRENCY_LEVELS:
+                    texts = generate_bucket_texts(HTTP_REQUESTS, bucket, seed=1000 * (i + 1) + concurrency)
+                    results.append({
+                        "mode": "http",
+                        "length_bucket": list(bucket),
+                        "concurrency": concurrency,
+                        **await benchmark_http(client, texts, concurrency),
+                    })
+    finally:
+        await app.state.registry.close()
+        app.state.registry = None
+
+    return results
+
+
+def main():
+    models_dir = Path("src") / "models"
+    output_path = Path("data") / "benchmarks" / "inference.json"
+    results = []
+
+    for model_path in sorted(models_dir.glob("*.pkl")):
+        model = ModelWrapper()
+        model.load(model_path)
+
+        model_results = [
+            {
+                "mode": "direct",
+                "length_bucket": list(bucket),
+                "concurrency": 1,
+                **benchmark_direct(model, generate_bucket_texts(DIRECT_REQUESTS, bucket, seed=i)),
+            }
+            for i, bucket in enumerate(LENGTH_BUCKETS)
+        ]
+        model_results += asyncio.run(benchmark_model_http(model_path))
+
+        for result in model_results:
+            print(
+                f"{model_path.stem:<28}{result['mode']:<8}{str(tuple(result['length_bucket'])):<14}"
+                f"c={result['concurrency']:<4}p50={result['p50_ms']:7.2f}ms  p95={result['p95_ms']:7.2f}ms  "
+                f"p99={result['p99_ms']:7.2f}ms  {result['rps']:8.1f} req/s"
+            )
+            results.append({"model": model_path.stem, **result})
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps({
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "results": results,
+    }, indent=2))
+    print(f"Results written to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
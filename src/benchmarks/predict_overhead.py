@@ -0,0 +1,46 @@
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from src.features.text_metrics import TextMetricCalculator
+from src.model_impl.wrapper import ModelWrapper
+from src.benchmarks.synthetic import generate_texts
+
+
+def legacy_predict_proba(model: ModelWrapper, text: str) -> float:
+    style_metrics = vars(TextMetricCalculator(text).all_metrics)
+    sample_df = pd.DataFrame(
+        [{**{"text": text}, **style_metrics}]
+    )
+    return model.model.predict_proba(sample_df)[0][1]
+
+
+def time_per_call(fn, texts: list[str]) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        fn(text)
+    return (time.perf_counter() - start) / len(texts)
+
+
+def main():
+    models_dir = Path("src") / "models"
+    texts = generate_texts(200)
+
+    print(f"{'model':<28}{'legacy ms':>12}{'current ms':>12}{'saved ms':>12}")
+
+    for model_path in sorted(models_dir.glob("*.pkl")):
+        model = ModelWrapper()
+        model.load(model_path)
+
+        legacy = time_per_call(lambda text: legacy_predict_proba(model, text), texts)
+        current = time_per_call(model.predict, texts)
+
+        print(
+            f"{model_path.stem:<28}{legacy * 1000:>12.3f}{current * 1000:>12.3f}"
+            f"{(legacy - current) * 1000:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import random
+
+WORDS = (
+    "the of and to in is that it was for on are with as be this by at have from "
+    "or an but not they we you which their one all been has more will would there "
+    "model data human text language system people time research however moreover "
+    "analysis result important example different because process experience world "
+    "technology question answer writing style sentence paragraph really just maybe"
+).split()
+
+PUNCTUATION = [".", ".", ".", "!", "?", ";", ","]
+
+# Weak per-class word preferences, so labeled corpora are learnable but not trivially so
+AI_MARKERS = "moreover furthermore additionally overall notably consequently".split()
+HUMAN_MARKERS = "really just maybe honestly kinda basically".split()
+
+
+def generate_text(
+    rng: random.Random,
+    min_length: int,
+    max_length: int,
+    words: list[str] = WORDS
+) -> str:
+    target_length = rng.randint(min_length, max_length)
+    parts: list[str] = []
+    length = 0
+
+    while length < target_length:
+        sentence = " ".join(rng.choice(words) for _ in range(rng.randint(4, 18)))
+        sentence = sentence.capitalize() + rng.choice(PUNCTUATION)
+        parts.append(sentence)
+        length += len(sentence) + 1
+
+    return " ".join(parts)[:target_length].strip() or "text"
+
+
+def generate_texts(
+    n: int,
+    min_length: int = 300,
+    max_length: int = 350,
+    seed: int = 42
+) -> list[str]:
+    rng = random.Random(seed)
+    return [generate_text(rng, min_length, max_length) for _ in range(n)]
+
+
+def generate_labeled_texts(
+    n: int,
+    min_length: int = 300,
+    max_length: int = 350,
+    seed: int = 42
+) -> tuple[list[str], list[int]]:
+    rng = random.Random(seed)
+    ai_words = WORDS + AI_MARKERS
+    human_words = WORDS + HUMAN_MARKERS
+
+    texts = []
+    labels = []
+    for _ in range(n):
+        label = rng.randint(0, 1)
+        texts.append(generate_text(rng, min_length, max_length, ai_words if label else human_words))
+        labels.append(label)
+
+    return texts, labels
@@ -0,0 +1,215 @@
+import math
+import re
+import time
+import tracemalloc
+from collections import Counter
+
+import numpy as np
+
+from src.config.config import config
+from src.features.text_metrics import (
+    AllTextMetrics,
+    TextMetricCalculator,
+    TextMetricBatchCalculator
+)
+from src.benchmarks.synthetic import generate_texts
+
+SCALING_SIZES = (5_000, 20_000, 70_000)
+
+
+class LegacyTextMetricCalculator:
+    """Multi-pass reference implementation kept for comparison"""
+
+
+    def __init__(self, text: str) -> None:
+        self.text = text.strip()
+        self._words = self._tokenize_words(self.text)
+        self._sentences = self._text_to_sentences(self.text)
+
+    def _tokenize_words(self, text: str) -> list[str]:
+        return re.findall(r"\b\w+\b", text.lower())
+
+    def _text_to_sentences(self, text: str) -> list[str]:
+        sentences = config.text_metric.SENTENCE_SPLIT_REGEX.split(text)
+        return [s for s in sentences if s.strip()]
+
+    # Basic metrics
+
+    @property
+    def word_count(self) -> int:
+        return len(self._words)
+
+    @property
+    def text_length(self) -> int:
+        return len(self.text)
+
+    @property
+    def sentence_count(self) -> int:
+        return max(len(self._sentences), 1)
+
+    # Average metrics
+
+    @property
+    def avg_sentence_length(self) -> float:
+        return sum(len(word) for word in self._words) / self.word_count if self.word_count else 0.0
+
+    @property
+    def avg_word_length(self) -> float:
+        return self.text_length / self.word_count if self.word_count else 0.0
+
+    # Lexical metrics
+
+    @property
+    def vocab_size(self) -> int:
+        return len(set(self._words))
+
+    @property
+    def vocab_richness(self) -> float:
+        return self.vocab_size / self.word_count if self.word_count else 0.0
+
+    @property
+    def repetition_ratio(self) -> float:
+        return 1.0 - self.vocab_richness
+
+    # Punctuation metrics
+
+    def _regex_count_ratio(self, regex) -> float:
+        if self.text_length == 0:
+            return 0.0
+        return len(regex.findall(self.text)) / self.text_length
+
+    @property
+    def punctuation_ratio(self) -> float:
+        return self._regex_count_ratio(config.text_metric.PUNCTUATION_REGEX)
+
+    @property
+    def exclamation_ratio(self) -> float:
+        return self._regex_count_ratio(config.text_metric.EXCLAMATION_REGEX)
+
+    @property
+    def question_ratio(self) -> float:
+        return self._regex_count_ratio(config.text_metric.QUESTION_REGEX)
+
+    @property
+    def uppercase_word_ratio(self) -> float:
+        if self.word_count == 0:
+            return 0.0
+        uppercase_words = sum(word.isupper() for word in self._words)
+        return uppercase_words / self.word_count
+
+    # Entropy
+
+    @property
+    def entropy(self) -> float:
+        
+        if self.word_count == 0:
+            return 0.0
+
+        counts = Counter(self._words)
+        entropy = 0.0
+
+        for count in counts.values():
+            p = count / self.word_count
+            entropy -= p * math.log2(p)
+
+        return entropy
+
+
+    # Stopwords
+    @property
+    def stopwords_ratio(self):
+        if self.word_count == 0:
+            return 0.0
+        
+        stopword_count = sum(word in config.text_metric.STOP_WORDS for word in self._words)
+        return stopword_count / self.word_count
+    
+    # All metrics
+
+    @property
+    def all_metrics(self) -> AllTextMetrics:
+        return AllTextMetrics(
+            word_count=self.word_count,
+            text_length=self.text_length,
+            sentence_count=self.sentence_count,
+            avg_sentence_length=self.avg_sentence_length,
+            avg_word_length=self.avg_word_length,
+            vocab_size=self.vocab_size,
+            vocab_richness=self.vocab_richness,
+            repetition_ratio=self.repetition_ratio,
+            punctuation_ratio=self.punctuation_ratio,
+            exclamation_ratio=self.exclamation_ratio,
+            question_ratio=self.question_ratio,
+            uppercase_word_ratio=self.uppercase_word_ratio,
+            entropy=self.entropy,
+            stopwords_ratio=self.stopwords_ratio
+        )
+
+
+def time_per_text(calculator_cls, texts: list[str], repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for text in texts:
+            calculator_cls(text).all_metrics
+    return (time.perf_counter() - start) / (repeats * len(texts))
+
+
+def peak_memory_mb(compute) -> float:
+    tracemalloc.start()
+    try:
+        compute()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def per_text_matrix(texts: list[str]) -> np.ndarray:
+    return np.asarray(
+        [[value for _, value in TextMetricCalculator(text).all_metrics] for text in texts],
+        dtype=float
+    )
+
+
+def report_scaling() -> None:
+    # Peak memory should grow with the output only; superlinear growth means the batch working set is unbounded
+    for size in SCALING_SIZES:
+        texts = generate_texts(size, min_length=300, max_length=350)
+        batch = peak_memory_mb(lambda: TextMetricBatchCalculator(texts).metrics_matrix)
+        per_text = peak_memory_mb(lambda: per_text_matrix(texts))
+
+        print(f"{size:>7} texts: batch peak {batch:7.1f} MB, per-text peak {per_text:7.1f} MB")
+
+
+def main():
+    texts = generate_texts(2000, min_length=300, max_length=350)
+    texts += ["", "   ", "!!!", "WHY?! Because.", "Ünïcödé wörds, naïve café."]
+
+    mismatches = [
+        text for text in texts
+        if TextMetricCalculator(text).all_metrics != LegacyTextMetricCalculator(text).all_metrics
+    ]
+    if mismatches:
+        raise AssertionError(f"{len(mismatches)} texts differ, first: {mismatches[0]!r}")
+
+    if not np.allclose(TextMetricBatchCalculator(texts).metrics_matrix, per_text_matrix(texts)):
+        raise AssertionError("Batch metrics differ from the per-text metrics")
+
+    legacy = time_per_text(LegacyTextMetricCalculator, texts, repeats=5)
+    current = time_per_text(TextMetricCalculator, texts, repeats=5)
+
+    start = time.perf_counter()
+    for _ in range(5):
+        TextMetricBatchCalculator(texts).metrics_matrix
+    batch = (time.perf_counter() - start) / (5 * len(texts))
+
+    print(f"Checked {len(texts)} texts: outputs are identical")
+    print(f"legacy : {legacy * 1e6:8.2f} us/text")
+    print(f"current: {current * 1e6:8.2f} us/text")
+    print(f"batch  : {batch * 1e6:8.2f} us/text")
+    print(f"speedup: {legacy / current:8.2f}x (batch {legacy / batch:.2f}x)")
+
+    report_scaling()
+
+
+if __name__ == "__main__":
+    main()
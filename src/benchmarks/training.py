@@ -0,0 +1,141 @@
+import json
+import multiprocessing
+import platform
+import resource
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+
+from src.benchmarks.synthetic import generate_labeled_texts
+from src.training.model_configs import MODEL_CONFIGS, ModelConfig
+from src.utils.dataset import load_dataset
+
+CORPUS_SIZES = (2_000, 8_000, 32_000)
+
+
+class StageTimer:
+    """Stands in for FeatureCache so train() reports the wall time of every feature block"""
+
+
+    def __init__(self) -> None:
+        self.stages: dict[str, float] = {}
+
+    def fit_transform(self, transformer, X_train, X_test):
+        name = type(transformer).__name__
+        if name == "Pipeline":
+            name = "+".join(type(step).__name__ for _, step in transformer.steps)
+        if getattr(transformer, "analyzer", None):
+            name = f"{transformer.analyzer}_{name}"
+
+        start = time.perf_counter()
+        fitted = clone(transformer)
+        train_matrix = fitted.fit_transform(X_train)
+        test_matrix = fitted.transform(X_test)
+        self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+        return fitted, train_matrix, test_matrix
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if platform.system() == "Darwin" else peak / 2**10
+
+
+def profile_training(config: ModelConfig, dataset_path: Path, output_dir: Path) -> dict:
+    """Mirrors train_single_model stage by stage; runs in a fresh process so peak RSS is its own"""
+    baseline_rss = peak_rss_mb()
+    stages: dict[str, float] = {}
+
+    start = time.perf_counter()
+    dataset = load_dataset(dataset_path)
+    stages["csv_parse"] = time.perf_counter() - start
+
+    model = config.model_cls()
+    model.init_model(**config.init_kwargs)
+
+    timer = StageTimer()
+    start = time.perf_counter()
+    performance = model.train(dataset=dataset, feature_cache=timer)
+    train_seconds = time.perf_counter() - start
+
+    stages.update(timer.stages)
+    # Online models stream their own features, so for them this is the whole fit
+    stages["classifier"] = train_seconds - sum(timer.stages.values())
+
+    start = time.perf_counter()
+    model.save(output_dir / f"{config.name}.pkl")
+    stages["save"] = time.perf_counter() - start
+
+    n_iter = getattr(model.model.steps[-1][1], "n_iter_", None)
+
+    return {
+        "model": config.name,
+        "n_samples": len(dataset),
+        "stages_seconds": stages,
+        "total_seconds": sum(stages.values()),
+        "n_iter": int(np.max(n_iter)) if n_iter is not None else None,
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": peak_rss_mb(),
+        "f1": float(performance.f1),
+    }
+
+
+def write_corpus(path: Path, n: int) -> None:
+    texts, labels = generate_labeled_texts(n)
+    pd.DataFrame({"text": texts, "generated": labels}).to_csv(path, index=False)
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    output_path = Path("data") / "benchmarks" / "training.json"
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        for n in CORPUS_SIZES:
+            dataset_path = tmp / f"corpus_{n}.csv"
+            write_corpus(dataset_path, n)
+
+            for config in MODEL_CONFIGS:
+                with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                    result = pool.submit(profile_training, config, dataset_path, tmp).result()
+
+                results.append(result)
+                stages = "  ".join(f"{name}={seconds:.2f}s" for name, seconds in result["stages_seconds"].items())
+                print(
+                    f"{config.name:<18}{n:>8}  total={result['total_seconds']:.2f}s  "
+                    f"n_iter={result['n_iter']}  peak_rss={result['peak_rss_mb']:.0f}MB  {stages}"
+                )
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps({
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "corpus_sizes": list(CORPUS_SIZES),
+        "results": results,
+    }, indent=2))
+    print(f"Results written to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,24 @@
+import os
 import re
+from pathlib import Path
 from re import Pattern
 
-import nltk
-from nltk.corpus import stopwords
-
-nltk.download('stopwords')
+from src.config.stopwords import load_stop_words
 
 
 class TextMetricConfig:
+    WORD_REGEX: Pattern = re.compile(r"\w+")
     SENTENCE_SPLIT_REGEX: Pattern = re.compile(r"[.!?]+")
     PUNCTUATION_REGEX: Pattern = re.compile(r"[.,!?;:()\[\]{}\"']")
     EXCLAMATION_REGEX: Pattern = re.compile(r"[!]")
     QUESTION_REGEX: Pattern = re.compile(r"[?]")
-    STOP_WORDS: set[str] = set(stopwords.words("english"))
+    VECTORIZED_MIN_BATCH_SIZE: int = 256
+    PARALLEL_CHUNK_SIZE: int = 20_000
+    BATCH_SLICE_SIZE: int = 4_096
+
+    @property
+    def STOP_WORDS(self) -> frozenset[str]:
+        return load_stop_words("english")
 
 class DatasetAnalyzeConfig:
     MIN_TEXT_LENGTH: int = 300
@@ -23,9 +29,54 @@ class DatasetAnalyzeConfig:
     AI_GENERATED_TEST_DATASET_SIZE: int = 1500
     HUMAN_WRITTEN_TEST_DATASET_SIZE: int = 1500
 
+class TrainingConfig:
+    DATASET_CHUNK_SIZE: int = int(os.getenv("CLASSIFIER_DATASET_CHUNK_SIZE", "50000"))
+
+class CascadeConfig:
+    # The heavy model is consulted only when the cheap model's probability_ai falls inside [LOW, HIGH]
+    UNCERTAINTY_LOW: float = float(os.getenv("CLASSIFIER_CASCADE_UNCERTAINTY_LOW", "0.05"))
+    UNCERTAINTY_HIGH: float = float(os.getenv("CLASSIFIER_CASCADE_UNCERTAINTY_HIGH", "0.95"))
+
+class DocumentConfig:
+    # Chars shared by consecutive windows, so no sentence is only ever seen cut in half
+    SEGMENT_OVERLAP: int = int(os.getenv("CLASSIFIER_DOCUMENT_SEGMENT_OVERLAP", "50"))
+    BATCH_SIZE: int = int(os.getenv("CLASSIFIER_DOCUMENT_BATCH_SIZE", "256"))
+
+class ScoringConfig:
+    CHUNK_SIZE: int = int(os.getenv("CLASSIFIER_SCORING_CHUNK_SIZE", "20000"))
+    WORKERS: int = int(os.getenv("CLASSIFIER_SCORING_WORKERS", str(os.cpu_count() or 1)))
+
+class ServerConfig:
+    MODEL_PATH: Path = Path(
+        os.getenv("CLASSIFIER_MODEL_PATH", str(Path("src") / "models" / "wcmsl_more_words_finetuned.pkl"))
+    )
+    MODELS_DIR: Path = Path(os.getenv("CLASSIFIER_MODELS_DIR", str(Path("src") / "models")))
+    # Comma-separated model names to serve; empty serves every MODEL_CONFIGS entry with a saved file
+    MODELS: list[str] = [name for name in os.getenv("CLASSIFIER_MODELS", "").split(",") if name]
+    ADMIN_TOKEN: str | None = os.getenv("CLASSIFIER_ADMIN_TOKEN") or None
+    MAX_DOCUMENT_BYTES: int = int(os.getenv("CLASSIFIER_MAX_DOCUMENT_BYTES", str(16 * 2**20)))
+    WARMUP_ROUNDS: int = int(os.getenv("CLASSIFIER_WARMUP_ROUNDS", "3"))
+    COMPILED_INFERENCE: bool = os.getenv("CLASSIFIER_COMPILED_INFERENCE", "0") == "1"
+
+    MAX_BATCH_SIZE: int = int(os.getenv("CLASSIFIER_MAX_BATCH_SIZE", "64"))
+    MAX_BATCH_WAIT_MS: float = float(os.getenv("CLASSIFIER_MAX_BATCH_WAIT_MS", "5"))
+    MAX_QUEUE_SIZE: int = int(os.getenv("CLASSIFIER_MAX_QUEUE_SIZE", "1024"))
+
+    EXECUTOR_MODE: str = os.getenv("CLASSIFIER_EXECUTOR_MODE", "thread")
+    EXECUTOR_WORKERS: int = int(os.getenv("CLASSIFIER_EXECUTOR_WORKERS", "2"))
+    EXECUTOR_MAX_PENDING: int = int(os.getenv("CLASSIFIER_EXECUTOR_MAX_PENDING", "32"))
+
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CLASSIFIER_CACHE_MAX_ENTRIES", "10000"))
+    CACHE_TTL_SECONDS: float = float(os.getenv("CLASSIFIER_CACHE_TTL_SECONDS", "3600"))
+
 class Config:
     text_metric: TextMetricConfig = TextMetricConfig()
     dataset_analyze: DatasetAnalyzeConfig = DatasetAnalyzeConfig()
+    training: TrainingConfig = TrainingConfig()
+    cascade: CascadeConfig = CascadeConfig()
+    document: DocumentConfig = DocumentConfig()
+    scoring: ScoringConfig = ScoringConfig()
+    server: ServerConfig = ServerConfig()
 
 config = Config()
 
@@ -0,0 +1,37 @@
+from functools import cache
+from pathlib import Path
+
+RESOURCES_DIR = Path(__file__).parent / "resources"
+
+
+def stop_words_path(language: str = "english") -> Path:
+    return RESOURCES_DIR / f"{language}_stopwords.txt"
+
+
+@cache
+def load_stop_words(language: str = "english") -> frozenset[str]:
+    with open(stop_words_path(language), encoding="utf-8") as f:
+        return frozenset(word for word in f.read().split("\n") if word)
+
+
+def snapshot_stop_words(language: str = "english") -> Path:
+    """Refreshes the vendored list from the NLTK corpus (requires network once)"""
+    import nltk
+    from nltk.corpus import stopwords
+
+    nltk.download("stopwords", quiet=True)
+
+    path = stop_words_path(language)
+    path.write_text("\n".join(stopwords.words(language)) + "\n", encoding="utf-8")
+    load_stop_words.cache_clear()
+
+    return path
+
+
+def main():
+    path = snapshot_stop_words()
+    print(f"Saved {len(load_stop_words())} stopwords to {path}")
+
+
+if __name__ == "__main__":
+    main()
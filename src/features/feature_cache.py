@@ -0,0 +1,95 @@
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.base import clone
+
+from src.utils.atomic import write_directory_atomic
+
+
+TRANSFORMER_FILE = "transformer.joblib"
+
+
+def texts_fingerprint(X) -> str:
+    # Series and single-column frames of the same texts share a fingerprint
+    texts = np.asarray(X, dtype=object).ravel()
+    row_hashes = pd.util.hash_array(texts, categorize=False)
+
+    return hashlib.sha256(row_hashes.tobytes()).hexdigest()
+
+
+@dataclass(frozen=True)
+class FeatureCacheStats:
+    hits: int
+    misses: int
+
+
+class FeatureCache:
+    """On-disk cache of fitted feature transformers and the train/test matrices they produce"""
+
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, transformer, X_train, X_test) -> str:
+        return joblib.hash((
+            clone(transformer),
+            texts_fingerprint(X_train),
+            texts_fingerprint(X_test),
+        ))
+
+    def fit_transform(self, transformer, X_train, X_test):
+        """Returns (fitted transformer, train matrix, test matrix), fitting only on a cache miss"""
+        entry = self.directory / self.key(transformer, X_train, X_test)
+
+        if entry.is_dir():
+            self.hits += 1
+            return self._load(entry)
+
+        self.misses += 1
+
+        fitted = clone(transformer)
+        train_matrix = fitted.fit_transform(X_train)
+        test_matrix = fitted.transform(X_test)
+
+        self._store(entry, fitted, train_matrix, test_matrix)
+
+        return fitted, train_matrix, test_matrix
+
+    def stats(self) -> FeatureCacheStats:
+        return FeatureCacheStats(hits=self.hits, misses=self.misses)
+
+    def _store(self, entry: Path, fitted, train_matrix, test_matrix) -> None:
+        def write(directory: Path) -> None:
+            joblib.dump(fitted, directory / TRANSFORMER_FILE)
+            self._save_matrix(directory / "train", train_matrix)
+            self._save_matrix(directory / "test", test_matrix)
+
+        write_directory_atomic(entry, write)
+
+    def _load(self, entry: Path):
+        return (
+            joblib.load(entry / TRANSFORMER_FILE),
+            self._load_matrix(entry / "train"),
+            self._load_matrix(entry / "test"),
+        )
+
+    @staticmethod
+    def _save_matrix(path: Path, matrix) -> None:
+        if sparse.issparse(matrix):
+            sparse.save_npz(path.with_suffix(".npz"), matrix.tocsr(), compressed=False)
+        else:
+            np.save(path.with_suffix(".npy"), np.asarray(matrix))
+
+    @staticmethod
+    def _load_matrix(path: Path):
+        if path.with_suffix(".npz").exists():
+            return sparse.load_npz(path.with_suffix(".npz"))
+
+        return np.load(path.with_suffix(".npy"))
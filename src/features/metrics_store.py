@@ -0,0 +1,106 @@
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.config.config import config
+from src.features.feature_cache import texts_fingerprint
+from src.features.text_metrics import (
+    METRIC_NAMES,
+    TextMetricBatchCalculator
+)
+from src.utils.atomic import write_directory_atomic
+
+
+# Bump when a metric's definition changes without a config change
+METRICS_STORE_VERSION = 1
+
+
+def metrics_config_fingerprint() -> str:
+    text_metric = config.text_metric
+    parts = [
+        str(METRICS_STORE_VERSION),
+        *METRIC_NAMES,
+        *(
+            f"{regex.pattern}/{regex.flags}"
+            for regex in (
+                text_metric.WORD_REGEX,
+                text_metric.SENTENCE_SPLIT_REGEX,
+                text_metric.PUNCTUATION_REGEX,
+                text_metric.EXCLAMATION_REGEX,
+                text_metric.QUESTION_REGEX,
+            )
+        ),
+        *sorted(text_metric.STOP_WORDS),
+    ]
+
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class MetricsStore:
+    """Columnar on-disk store of stylometric metrics, one memory-mapped .npy per metric"""
+
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+
+    def key(self, texts) -> str:
+        # Any change to the texts, the regexes or the stopwords yields a new key
+        return hashlib.sha256(
+            f"{metrics_config_fingerprint()}:{texts_fingerprint(texts)}".encode()
+        ).hexdigest()
+
+    def load(self, texts) -> np.ndarray | None:
+        return self._load(self.directory / self.key(texts))
+
+    def _load(self, entry: Path) -> np.ndarray | None:
+        if not entry.is_dir():
+            return None
+
+        return np.column_stack([
+            np.load(entry / f"{name}.npy", mmap_mode="r")
+            for name in METRIC_NAMES
+        ])
+
+    def metrics_matrix(self, texts, n_jobs: int | None = None, chunk_size: int | None = None) -> np.ndarray:
+        if isinstance(texts, pd.DataFrame):
+            texts = texts.iloc[:, 0]
+
+        entry = self.directory / self.key(texts)
+
+        matrix = self._load(entry)
+        if matrix is not None:
+            return matrix
+
+        self._store(entry, TextMetricBatchCalculator(texts), n_jobs, chunk_size)
+
+        return self._load(entry)
+
+    def metrics_dataframe(self, texts, n_jobs: int | None = None, chunk_size: int | None = None) -> pd.DataFrame:
+        return TextMetricBatchCalculator.to_dataframe(self.metrics_matrix(texts, n_jobs, chunk_size))
+
+    def _store(
+        self,
+        entry: Path,
+        calculator: TextMetricBatchCalculator,
+        n_jobs: int | None,
+        chunk_size: int | None
+    ) -> None:
+        def write(directory: Path) -> None:
+            # Each chunk goes straight to the memory-mapped columns, so no full matrix is ever held in memory
+            columns = [
+                np.lib.format.open_memmap(directory / f"{name}.npy", mode="w+", shape=(len(calculator.texts),))
+                for name in METRIC_NAMES
+            ]
+
+            start = 0
+            for block in calculator.iter_metrics_blocks(n_jobs=n_jobs, chunk_size=chunk_size):
+                for i, column in enumerate(columns):
+                    column[start:start + len(block)] = block[:, i]
+                start += len(block)
+
+            for column in columns:
+                column.flush()
+
+        write_directory_atomic(entry, write)
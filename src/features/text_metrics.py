@@ -1,6 +1,6 @@
 import math
-import re
 from collections import Counter
+from itertools import chain
 from dataclasses import (
     dataclass,
     fields
@@ -10,12 +10,16 @@ from typing import (
     Protocol,
     TypeVar,
     Iterator,
+    Iterable,
     Any
 )
 
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
+from joblib import (
+    Parallel,
+    delayed
+)
 
 from sklearn.base import BaseEstimator, TransformerMixin
 
@@ -58,6 +62,9 @@ class AllTextMetrics:
             f"{key}: {value:.4f}" if isinstance(value, float) else f"{key}: {value}"
             for key, value in metrics.items()
         )
+
+
+METRIC_NAMES: tuple[str, ...] = tuple(f.name for f in fields(AllTextMetrics))
     
 
 class TextMetricCalculatorProtocol(Protocol):
@@ -69,6 +76,7 @@ class TextMetricCalculatorProtocol(Protocol):
 
 
 class TextMetricCalculator:
+    """Tokenizes once and derives every metric from shared counts"""
 
 
     def __init__(self, text: str) -> None:
@@ -76,8 +84,33 @@ class TextMetricCalculator:
         self._words = self._tokenize_words(self.text)
         self._sentences = self._text_to_sentences(self.text)
 
+        self._word_counts = Counter(self._words)
+        self._punctuation_counts = Counter(
+            config.text_metric.PUNCTUATION_REGEX.findall(self.text)
+        )
+
+        self._word_count = len(self._words)
+        self._text_length = len(self.text)
+        self._vocab_size = len(self._word_counts)
+
+        characters = 0
+        uppercase_words = 0
+        stopwords = 0
+        stop_words = config.text_metric.STOP_WORDS
+
+        for word, count in self._word_counts.items():
+            characters += len(word) * count
+            if word.isupper():
+                uppercase_words += count
+            if word in stop_words:
+                stopwords += count
+
+        self._word_characters = characters
+        self._uppercase_words = uppercase_words
+        self._stopwords = stopwords
+
     def _tokenize_words(self, text: str) -> list[str]:
-        return re.findall(r"\b\w+\b", text.lower())
+        return config.text_metric.WORD_REGEX.findall(text.lower())
 
     def _text_to_sentences(self, text: str) -> list[str]:
         sentences = config.text_metric.SENTENCE_SPLIT_REGEX.split(text)
@@ -87,11 +120,11 @@ class TextMetricCalculator:
 
     @property
     def word_count(self) -> int:
-        return len(self._words)
+        return self._word_count
 
     @property
     def text_length(self) -> int:
-        return len(self.text)
+        return self._text_length
 
     @property
     def sentence_count(self) -> int:
@@ -101,21 +134,21 @@ class TextMetricCalculator:
 
     @property
     def avg_sentence_length(self) -> float:
-        return sum(len(word) for word in self._words) / self.word_count if self.word_count else 0.0
+        return self._word_characters / self._word_count if self._word_count else 0.0
 
     @property
     def avg_word_length(self) -> float:
-        return self.text_length / self.word_count if self.word_count else 0.0
+        return self._text_length / self._word_count if self._word_count else 0.0
 
     # Lexical metrics
 
     @property
     def vocab_size(self) -> int:
-        return len(set(self._words))
+        return self._vocab_size
 
     @property
     def vocab_richness(self) -> float:
-        return self.vocab_size / self.word_count if self.word_count else 0.0
+        return self._vocab_size / self._word_count if self._word_count else 0.0
 
     @property
     def repetition_ratio(self) -> float:
@@ -123,43 +156,42 @@ class TextMetricCalculator:
 
     # Punctuation metrics
 
-    def _regex_count_ratio(self, regex) -> float:
-        if self.text_length == 0:
+    def _punctuation_ratio(self, count: int) -> float:
+        if self._text_length == 0:
             return 0.0
-        return len(regex.findall(self.text)) / self.text_length
+        return count / self._text_length
 
     @property
     def punctuation_ratio(self) -> float:
-        return self._regex_count_ratio(config.text_metric.PUNCTUATION_REGEX)
+        return self._punctuation_ratio(self._punctuation_counts.total())
 
     @property
     def exclamation_ratio(self) -> float:
-        return self._regex_count_ratio(config.text_metric.EXCLAMATION_REGEX)
+        return self._punctuation_ratio(self._punctuation_counts["!"])
 
     @property
     def question_ratio(self) -> float:
-        return self._regex_count_ratio(config.text_metric.QUESTION_REGEX)
+        return self._punctuation_ratio(self._punctuation_counts["?"])
 
     @property
     def uppercase_word_ratio(self) -> float:
-        if self.word_count == 0:
+        if self._word_count == 0:
             return 0.0
-        uppercase_words = sum(word.isupper() for word in self._words)
-        return uppercase_words / self.word_count
+        return self._uppercase_words / self._word_count
 
     # Entropy
 
     @property
     def entropy(self) -> float:
         
-        if self.word_count == 0:
+        if self._word_count == 0:
             return 0.0
 
-        counts = Counter(self._words)
+        word_count = self._word_count
         entropy = 0.0
 
-        for count in counts.values():
-            p = count / self.word_count
+        for count in self._word_counts.values():
+            p = count / word_count
             entropy -= p * math.log2(p)
 
         return entropy
@@ -168,11 +200,10 @@ class TextMetricCalculator:
     # Stopwords
     @property
     def stopwords_ratio(self):
-        if self.word_count == 0:
+        if self._word_count == 0:
             return 0.0
         
-        stopword_count = sum(word in config.text_metric.STOP_WORDS for word in self._words)
-        return stopword_count / self.word_count
+        return self._stopwords / self._word_count
     
     # All metrics
 
@@ -200,32 +231,213 @@ class TextMetricCalculator:
         cls,
         df: pd.DataFrame,
         text_col: str = "text",
+        n_jobs: int | None = None,
+        chunk_size: int | None = None,
+        store=None
     ) -> pd.DataFrame:
-        rows = []
+        if store is not None:
+            return store.metrics_dataframe(df[text_col], n_jobs=n_jobs, chunk_size=chunk_size)
 
-        for text in tqdm(
-            df[text_col],
-            total=len(df),
-            desc="Extracting text metrics"
-        ):
-            calculator = cls(text)
-            metrics = calculator.all_metrics
-            rows.append(dict(metrics))
+        calculator = TextMetricBatchCalculator(df[text_col])
+        return calculator.to_dataframe(
+            calculator.parallel_metrics_matrix(n_jobs=n_jobs, chunk_size=chunk_size)
+        )
+
+
+class TextMetricBatchCalculator:
+    """Column-oriented metrics for many texts, computed with vectorized string ops"""
+
+
+    def __init__(self, texts: Iterable[str]) -> None:
+        self.texts = pd.Series(list(texts), dtype=object).str.strip()
 
-        return pd.DataFrame(rows)
+    @staticmethod
+    def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        return np.divide(
+            numerator,
+            denominator,
+            out=np.zeros(len(numerator), dtype=float),
+            where=denominator > 0
+        )
+
+    @staticmethod
+    def _flatten(lists: pd.Series, lengths: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        values = np.fromiter(chain.from_iterable(lists), dtype=object, count=int(lengths.sum()))
+        rows = np.repeat(np.arange(len(lengths)), lengths)
+        return values, rows
+
+    @staticmethod
+    def _per_text_sum(rows: np.ndarray, values: np.ndarray, n: int) -> np.ndarray:
+        return np.bincount(rows, weights=values, minlength=n)
+
+    @property
+    def metrics_matrix(self) -> np.ndarray:
+        n = len(self.texts)
+        slice_size = config.text_metric.BATCH_SLICE_SIZE
+
+        # Token arrays are several times the size of the texts, so they only ever exist for one slice
+        matrix = np.empty((n, len(METRIC_NAMES)), dtype=float)
+        for start in range(0, n, slice_size):
+            matrix[start:start + slice_size] = self._slice_metrics_matrix(self.texts.iloc[start:start + slice_size])
+
+        return matrix
+
+    def _slice_metrics_matrix(self, texts: pd.Series) -> np.ndarray:
+        n = len(texts)
+
+        text_length = texts.str.len().to_numpy(dtype=float)
+
+        words = texts.str.lower().str.findall(config.text_metric.WORD_REGEX)
+        word_lengths = words.str.len().to_numpy(dtype=np.intp)
+        word_count = word_lengths.astype(float)
+
+        tokens, token_rows = self._flatten(words, word_lengths)
+        token_codes, vocabulary = pd.factorize(tokens)
+
+        vocabulary_lengths = np.fromiter(map(len, vocabulary), dtype=float, count=len(vocabulary))
+        vocabulary_uppercase = np.fromiter(map(str.isupper, vocabulary), dtype=float, count=len(vocabulary))
+        vocabulary_stopwords = pd.Index(vocabulary).isin(config.text_metric.STOP_WORDS).astype(float)
+
+        word_characters = self._per_text_sum(token_rows, vocabulary_lengths[token_codes], n)
+        uppercase_words = self._per_text_sum(token_rows, vocabulary_uppercase[token_codes], n)
+        stopwords = self._per_text_sum(token_rows, vocabulary_stopwords[token_codes], n)
+
+        # (row, word) pairs in first-occurrence order, matching Counter iteration
+        pair_codes, pairs = pd.factorize(token_rows * len(vocabulary) + token_codes)
+        frequencies = np.bincount(pair_codes).astype(float)
+        frequency_rows = pairs // max(len(vocabulary), 1)
+
+        vocab_size = np.bincount(frequency_rows, minlength=n).astype(float)
+
+        p = frequencies / word_count[frequency_rows]
+        entropy = 0.0 - self._per_text_sum(frequency_rows, p * np.log2(p), n)
+
+        sentences = texts.str.split(config.text_metric.SENTENCE_SPLIT_REGEX)
+        sentence_lengths = sentences.str.len().to_numpy(dtype=np.intp)
+        pieces, piece_rows = self._flatten(sentences, sentence_lengths)
+        non_empty_pieces = np.fromiter(map(str.strip, pieces), dtype=bool, count=len(pieces))
+        sentence_count = np.maximum(self._per_text_sum(piece_rows, non_empty_pieces, n), 1.0)
+
+        punctuation_marks = texts.str.findall(config.text_metric.PUNCTUATION_REGEX)
+        punctuation_lengths = punctuation_marks.str.len().to_numpy(dtype=np.intp)
+        marks, mark_rows = self._flatten(punctuation_marks, punctuation_lengths)
+
+        punctuation = punctuation_lengths.astype(float)
+        exclamations = self._per_text_sum(mark_rows, marks == "!", n)
+        questions = self._per_text_sum(mark_rows, marks == "?", n)
+
+        vocab_richness = self._ratio(vocab_size, word_count)
+
+        return np.column_stack([
+            word_count,
+            text_length,
+            sentence_count,
+            self._ratio(word_characters, word_count),
+            self._ratio(text_length, word_count),
+            vocab_size,
+            vocab_richness,
+            1.0 - vocab_richness,
+            self._ratio(punctuation, text_length),
+            self._ratio(exclamations, text_length),
+            self._ratio(questions, text_length),
+            self._ratio(uppercase_words, word_count),
+            entropy,
+            self._ratio(stopwords, word_count)
+        ])
+
+    def iter_metrics_blocks(
+        self,
+        n_jobs: int | None = None,
+        chunk_size: int | None = None
+    ) -> Iterator[np.ndarray]:
+        """Yields the metrics of consecutive chunk_size chunks of texts, in order"""
+        chunk_size = chunk_size or config.text_metric.PARALLEL_CHUNK_SIZE
+        n = len(self.texts)
+        chunks = (self.texts.iloc[start:start + chunk_size].tolist() for start in range(0, n, chunk_size))
+
+        # Serial runs go chunk by chunk too, so the working set is one chunk whatever n is
+        if n_jobs in (None, 1) or n <= chunk_size:
+            return map(_chunk_metrics_matrix, chunks)
+
+        # Workers import the config once, so stopwords and regexes are never pickled per chunk
+        return Parallel(n_jobs=n_jobs, backend="loky", return_as="generator")(
+            delayed(_chunk_metrics_matrix)(chunk) for chunk in chunks
+        )
+
+    def parallel_metrics_matrix(
+        self,
+        n_jobs: int | None = None,
+        chunk_size: int | None = None
+    ) -> np.ndarray:
+        matrix = np.empty((len(self.texts), len(METRIC_NAMES)), dtype=float)
+        start = 0
+        for block in self.iter_metrics_blocks(n_jobs=n_jobs, chunk_size=chunk_size):
+            matrix[start:start + len(block)] = block
+            start += len(block)
+
+        return matrix
+
+    @staticmethod
+    def to_dataframe(matrix: np.ndarray) -> pd.DataFrame:
+        df = pd.DataFrame(matrix, columns=list(METRIC_NAMES))
+
+        for name in ("word_count", "text_length", "sentence_count", "vocab_size"):
+            df[name] = df[name].astype(int)
+
+        return df
+
+    @property
+    def metrics_dataframe(self) -> pd.DataFrame:
+        return self.to_dataframe(self.metrics_matrix)
+
+
+def _chunk_metrics_matrix(texts: list[str]) -> np.ndarray:
+    return TextMetricBatchCalculator(texts).metrics_matrix
 
 class TextMetricsTransformer(BaseEstimator, TransformerMixin):
 
+    def __init__(self, n_jobs: int | None = None, chunk_size: int | None = None, store=None) -> None:
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
+        self.store = store
+
+    def __getstate__(self):
+        # The metrics store is a training-time cache, not part of the fitted model
+        return dict(super().__getstate__(), store=None)
+
+    def __setstate__(self, state):
+        # Transformers pickled before n_jobs/chunk_size/store existed
+        state.setdefault("n_jobs", None)
+        state.setdefault("chunk_size", None)
+        state.setdefault("store", None)
+        super().__setstate__(state)
+
     def fit(self, X, y=None):
         return self
 
+    def fit_transform(self, X, y=None, **fit_params):
+        if isinstance(X, pd.DataFrame):
+            X = X.iloc[:, 0]
+
+        # Only training data goes through the store; inference never touches the disk
+        if self.store is not None and len(X) >= config.text_metric.VECTORIZED_MIN_BATCH_SIZE:
+            return self.store.metrics_matrix(X, n_jobs=self.n_jobs, chunk_size=self.chunk_size)
+
+        return self.fit(X, y).transform(X)
+
     def transform(self, X):
         if isinstance(X, pd.DataFrame):
             X = X.iloc[:, 0]
 
+        if len(X) >= config.text_metric.VECTORIZED_MIN_BATCH_SIZE:
+            return TextMetricBatchCalculator(X).parallel_metrics_matrix(
+                n_jobs=self.n_jobs,
+                chunk_size=self.chunk_size
+            )
+
         rows = []
         for text in X:
             metrics = TextMetricCalculator(text).all_metrics
             rows.append([value for _, value in metrics])
 
-        return np.asarray(rows, dtype=float)
\ No newline at end of file
+        return np.asarray(rows, dtype=float).reshape(-1, len(METRIC_NAMES))
\ No newline at end of file
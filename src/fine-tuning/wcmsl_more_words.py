@@ -2,6 +2,7 @@ import sys
 
 from pathlib import Path
 
+from src.features.metrics_store import MetricsStore
 from src.model_impl import WCMSLModel
 
 def main():
@@ -11,7 +12,9 @@ def main():
 
     fine_tune_dataset = Path("data") / "raw" / "Test_AI_Human.csv"
 
-    performance = model.finetune(fine_tune_dataset)
+    metrics_store = MetricsStore(Path("data") / "metrics_store")
+
+    performance = model.finetune(fine_tune_dataset, metrics_store=metrics_store)
 
     print("Fine-tuning completed. New performance:")
     print(performance)
@@ -1,11 +1,15 @@
 from .combined_model import WCMSLModel
 from .metrics_model import MSModel
 from .word_character import WCLModel
+from .online_model import HWCSModel
 from .wrapper import ModelWrapper
+from .cascade import CascadeModel
 
 __all__ = [
     "WCMSLModel",
     "MSModel",
     "WCLModel",
-    "ModelWrapper"
+    "HWCSModel",
+    "ModelWrapper",
+    "CascadeModel"
 ]
\ No newline at end of file
@@ -0,0 +1,343 @@
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.features.text_metrics import TextMetricsTransformer
+from src.model_impl.prefitted import (
+    PrefittedTransformer,
+    unwrap_prefitted
+)
+
+ARTIFACT_FORMAT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+
+TFIDF_PARAMS = (
+    "input",
+    "encoding",
+    "decode_error",
+    "strip_accents",
+    "lowercase",
+    "analyzer",
+    "token_pattern",
+    "ngram_range",
+    "binary",
+    "norm",
+    "use_idf",
+    "smooth_idf",
+    "sublinear_tf",
+)
+
+
+# Multipliers of the n-gram hash; unlike hash() it is stable across processes, so the table is built once at export
+HASH_MULTIPLIER = np.uint64(0x9e3779b97f4a7c15)
+HASH_FINALIZER = np.uint64(0xff51afd7ed558ccd)
+
+
+class UnsupportedModelError(Exception):
+    pass
+
+
+@lru_cache
+def _word_multipliers(n_words: int) -> np.ndarray:
+    return np.arange(1, 2 * n_words, 2, dtype=np.uint64) * HASH_MULTIPLIER
+
+
+def ngram_hashes(terms: np.ndarray) -> np.ndarray:
+    """64-bit hash of the utf-8 bytes of every term in a fixed-width bytes array, mixed eight bytes at a time"""
+    n_words = -(-terms.dtype.itemsize // 8)
+    if terms.dtype.itemsize != n_words * 8:
+        terms = terms.astype(f"S{n_words * 8}")
+    words = np.ascontiguousarray(terms).view("<u8").reshape(len(terms), n_words)
+
+    # Each word gets its own odd multiplier and a nonlinear fold before the words are summed; the zero
+    # words that pad shorter terms add nothing, so a term hashes the same at any array width
+    mixed = words * _word_multipliers(n_words)
+    mixed ^= mixed >> np.uint64(32)
+    hashes = mixed.sum(axis=1, dtype=np.uint64)
+
+    # The slot comes from the low bits, which the multiplications alone leave independent of the high bytes
+    hashes ^= hashes >> np.uint64(33)
+    hashes *= HASH_FINALIZER
+    hashes ^= hashes >> np.uint64(33)
+
+    return hashes
+
+
+def build_hash_slots(terms: np.ndarray) -> np.ndarray:
+    """Open-addressing table of term rows by hash with linear probing, at most a quarter full; -1 marks a free slot"""
+    # The low load keeps probe runs short, so most lookups end at the home slot
+    mask = (1 << max(1, (4 * len(terms) - 1).bit_length())) - 1
+    slots = np.full(mask + 1, -1, dtype=np.int32)
+
+    rows = np.arange(len(terms))
+    positions = (ngram_hashes(terms) & np.uint64(mask)).astype(np.intp)
+
+    # Every round, each free slot goes to one of the terms probing it and the others move one slot on
+    while len(rows):
+        free = np.flatnonzero(slots[positions] == -1)
+        _, first = np.unique(positions[free], return_index=True)
+        winners = free[first]
+        slots[positions[winners]] = rows[winners]
+
+        probing = np.ones(len(rows), dtype=bool)
+        probing[winners] = False
+        rows = rows[probing]
+        positions = (positions[probing] + 1) & mask
+
+    return slots
+
+
+@dataclass(frozen=True)
+class TfidfBlock:
+    name: str
+    params: dict
+    terms: np.ndarray
+    columns: np.ndarray
+    idf: np.ndarray
+    slots: np.ndarray
+
+    @property
+    def n_features(self) -> int:
+        return len(self.idf)
+
+    @property
+    def vocabulary(self) -> dict[str, int]:
+        return {
+            term.decode("utf-8"): int(column)
+            for term, column in zip(self.terms.tolist(), self.columns.tolist())
+        }
+
+
+@dataclass(frozen=True)
+class MetricsBlock:
+    name: str
+    mean: np.ndarray
+    scale: np.ndarray
+
+    @property
+    def n_features(self) -> int:
+        return len(self.mean)
+
+
+@dataclass(frozen=True)
+class LinearModelArtifact:
+    """Flat-array representation of a TF-IDF/metrics + LogisticRegression pipeline"""
+
+    blocks: tuple[TfidfBlock | MetricsBlock, ...]
+    coef: np.ndarray
+    intercept: np.ndarray
+    classes: np.ndarray
+    sparse_output: bool
+    column_transformer: bool
+
+    # Export
+
+    @classmethod
+    def from_pipeline(cls, pipeline: Pipeline) -> "LinearModelArtifact":
+        features = pipeline.named_steps.get("features")
+        clf = pipeline.named_steps.get("clf")
+
+        if not isinstance(clf, LogisticRegression) or len(clf.classes_) != 2:
+            raise UnsupportedModelError("Only binary LogisticRegression classifiers can be exported")
+
+        if isinstance(features, ColumnTransformer):
+            blocks = tuple(
+                cls._block_from_transformer(name, transformer)
+                for name, transformer, _ in features.transformers_
+                if not (name == "remainder" and transformer == "drop")
+            )
+            sparse_output = bool(features.sparse_output_)
+            column_transformer = True
+        else:
+            blocks = (cls._block_from_transformer("metrics", features),)
+            sparse_output = False
+            column_transformer = False
+
+        return cls(
+            blocks=blocks,
+            coef=np.ascontiguousarray(clf.coef_[0], dtype=np.float64),
+            intercept=np.asarray(clf.intercept_, dtype=np.float64),
+            classes=np.asarray(clf.classes_),
+            sparse_output=sparse_output,
+            column_transformer=column_transformer
+        )
+
+    @staticmethod
+    def _block_from_transformer(name: str, transformer) -> TfidfBlock | MetricsBlock:
+        if isinstance(transformer, TfidfVectorizer):
+            params = transformer.get_params()
+            if params["preprocessor"] is not None or params["tokenizer"] is not None or params["stop_words"] is not None:
+                raise UnsupportedModelError(f"{name}: custom preprocessor/tokenizer/stop_words are not exportable")
+
+            vocabulary = transformer.vocabulary_
+            terms = np.array([term.encode("utf-8") for term in vocabulary], dtype=np.bytes_)
+            columns = np.fromiter(vocabulary.values(), dtype=np.int32, count=len(vocabulary))
+            order = np.argsort(terms, kind="stable")
+
+            return TfidfBlock(
+                name=name,
+                params={key: params[key] for key in TFIDF_PARAMS},
+                terms=terms[order],
+                columns=columns[order],
+                idf=np.asarray(transformer.idf_, dtype=np.float64),
+                slots=build_hash_slots(terms[order])
+            )
+
+        if isinstance(transformer, Pipeline) and len(transformer.steps) == 2:
+            metrics, scaler = (step for _, step in transformer.steps)
+            if isinstance(metrics, TextMetricsTransformer) and isinstance(scaler, StandardScaler):
+                return MetricsBlock(
+                    name=name,
+                    mean=np.asarray(scaler.mean_, dtype=np.float64),
+                    scale=np.asarray(scaler.scale_, dtype=np.float64)
+                )
+
+        raise UnsupportedModelError(f"{name}: {type(transformer).__name__} is not exportable")
+
+    def save(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+
+        blocks_manifest = []
+        for block in self.blocks:
+            if isinstance(block, TfidfBlock):
+                np.save(path / f"{block.name}.terms.npy", block.terms)
+                np.save(path / f"{block.name}.columns.npy", block.columns)
+                np.save(path / f"{block.name}.idf.npy", block.idf)
+                np.save(path / f"{block.name}.slots.npy", block.slots)
+                blocks_manifest.append({
+                    "name": block.name,
+                    "type": "tfidf",
+                    "params": {
+                        key: list(value) if isinstance(value, tuple) else value
+                        for key, value in block.params.items()
+                    }
+                })
+            else:
+                np.save(path / f"{block.name}.mean.npy", block.mean)
+                np.save(path / f"{block.name}.scale.npy", block.scale)
+                blocks_manifest.append({"name": block.name, "type": "metrics"})
+
+        np.save(path / "clf.coef.npy", self.coef)
+        np.save(path / "clf.intercept.npy", self.intercept)
+
+        manifest = {
+            "format_version": ARTIFACT_FORMAT_VERSION,
+            "column_transformer": self.column_transformer,
+            "sparse_output": self.sparse_output,
+            "classes": self.classes.tolist(),
+            "blocks": blocks_manifest
+        }
+        (path / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    # Import
+
+    @classmethod
+    def load(cls, path: Path, mmap: bool = True) -> "LinearModelArtifact":
+        manifest = json.loads((path / MANIFEST_FILE).read_text(encoding="utf-8"))
+
+        if manifest["format_version"] != ARTIFACT_FORMAT_VERSION:
+            raise UnsupportedModelError(
+                f"Artifact format {manifest['format_version']} is not supported "
+                f"(expected {ARTIFACT_FORMAT_VERSION})"
+            )
+
+        mmap_mode = "r" if mmap else None
+
+        def load_array(name: str) -> np.ndarray:
+            return np.load(path / f"{name}.npy", mmap_mode=mmap_mode)
+
+        blocks = []
+        for block in manifest["blocks"]:
+            name = block["name"]
+            if block["type"] == "tfidf":
+                terms = load_array(f"{name}.terms")
+                # Artifacts exported before the hash table existed get one built at load time
+                slots_exist = (path / f"{name}.slots.npy").exists()
+
+                blocks.append(TfidfBlock(
+                    name=name,
+                    params={
+                        key: tuple(value) if key == "ngram_range" else value
+                        for key, value in block["params"].items()
+                    },
+                    terms=terms,
+                    columns=load_array(f"{name}.columns"),
+                    idf=load_array(f"{name}.idf"),
+                    slots=load_array(f"{name}.slots") if slots_exist else build_hash_slots(terms)
+                ))
+            else:
+                blocks.append(MetricsBlock(
+                    name=name,
+                    mean=load_array(f"{name}.mean"),
+                    scale=load_array(f"{name}.scale")
+                ))
+
+        return cls(
+            blocks=tuple(blocks),
+            coef=load_array("clf.coef"),
+            intercept=load_array("clf.intercept"),
+            classes=np.asarray(manifest["classes"]),
+            sparse_output=manifest["sparse_output"],
+            column_transformer=manifest["column_transformer"]
+        )
+
+    def to_pipeline(self) -> Pipeline:
+        transformers = [self._transformer_from_block(block) for block in self.blocks]
+
+        if self.column_transformer:
+            features = ColumnTransformer(
+                transformers=[
+                    (block.name, PrefittedTransformer(transformer), "text")
+                    for block, transformer in zip(self.blocks, transformers)
+                ]
+            )
+            features.fit(pd.DataFrame({"text": [""]}))
+            unwrap_prefitted(features)
+            features.sparse_output_ = self.sparse_output
+        else:
+            features = transformers[0]
+
+        clf = LogisticRegression()
+        clf.coef_ = self.coef.reshape(1, -1)
+        clf.intercept_ = self.intercept
+        clf.classes_ = self.classes
+        clf.n_features_in_ = self.coef.shape[0]
+
+        return Pipeline(
+            steps=[
+                ("features", features),
+                ("clf", clf)
+            ]
+        )
+
+    @staticmethod
+    def _transformer_from_block(block: TfidfBlock | MetricsBlock):
+        if isinstance(block, TfidfBlock):
+            vectorizer = TfidfVectorizer(**block.params, vocabulary=block.vocabulary)
+            vectorizer.fit([""])
+            # fit copies the vocabulary into vocabulary_; dropping the parameter leaves one dict per worker
+            vectorizer.vocabulary = None
+            vectorizer.idf_ = block.idf
+            return vectorizer
+
+        scaler = StandardScaler()
+        scaler.mean_ = block.mean
+        scaler.scale_ = block.scale
+        scaler.var_ = np.square(block.scale)
+        scaler.n_features_in_ = block.n_features
+        scaler.n_samples_seen_ = 0
+
+        return Pipeline([
+            ("metrics", TextMetricsTransformer()),
+            ("scaler", scaler)
+        ])
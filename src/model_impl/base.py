@@ -109,8 +109,11 @@ class BaseModel(Protocol):
     ) -> ModelPerformance: ...
     def load(self, model_path: Path) -> None: ...
     def save(self, path: Path) -> None: ...
+    def export_artifact(self, path: Path) -> None: ...
     def predict(self, text: str) -> ModelPredictionDataclassProtocol: ...
+    def predict_many(self, texts: list[str]) -> list[ModelPredictionDataclassProtocol]: ...
 
 class ModelWrapperProtocol(Protocol):
     def load(self, model_path: Path) -> None: ...
     def predict(self, text: str) -> ModelPredictionDataclassProtocol: ...
+    def predict_many(self, texts: list[str]) -> list[ModelPredictionDataclassProtocol]: ...
@@ -0,0 +1,113 @@
+import hashlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.config.config import config
+from src.model_impl.base import (
+    ModelNotDefinedError,
+    ModelPredictionDataclassProtocol
+)
+from src.model_impl.mixin import BaseModelMixin
+from src.model_impl.wrapper import ModelWrapper
+
+
+@dataclass(frozen=True)
+class CascadeStats:
+    texts: int
+    escalated: int
+
+    @property
+    def escalation_rate(self) -> float:
+        return self.escalated / self.texts if self.texts else 0.0
+
+
+class CascadeModel:
+    """Answers with a cheap model and escalates to a heavy one only when the cheap model is uncertain"""
+
+
+    def __init__(
+        self,
+        cheap: BaseModelMixin | None = None,
+        heavy: BaseModelMixin | None = None,
+        uncertainty_band: tuple[float, float] | None = None
+    ) -> None:
+        low, high = uncertainty_band or (config.cascade.UNCERTAINTY_LOW, config.cascade.UNCERTAINTY_HIGH)
+        if not 0.0 <= low <= high <= 1.0:
+            raise ValueError(f"Invalid uncertainty band: ({low}, {high})")
+
+        self.cheap = cheap
+        self.heavy = heavy
+        self.uncertainty_band = (low, high)
+
+        self._texts = 0
+        self._escalated = 0
+        self._lock = threading.Lock()
+
+    def load(self, cheap_path: Path, heavy_path: Path, compiled: bool = False) -> None:
+        self.cheap = ModelWrapper()
+        self.heavy = ModelWrapper()
+
+        for model, path in ((self.cheap, cheap_path), (self.heavy, heavy_path)):
+            if compiled:
+                model.load_compiled(path)
+            else:
+                model.load(path)
+
+    @property
+    def fingerprint(self) -> str | None:
+        if self.cheap is None or self.heavy is None:
+            return None
+
+        # The band is part of the identity: the same texts get different answers under another band
+        key = f"{self.cheap.fingerprint}:{self.heavy.fingerprint}:{self.uncertainty_band}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def stats(self) -> CascadeStats:
+        with self._lock:
+            return CascadeStats(texts=self._texts, escalated=self._escalated)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._texts = 0
+            self._escalated = 0
+
+    def predict(self, text: str, result_ai_ge=0.5) -> ModelPredictionDataclassProtocol:
+        return self.predict_many([text], result_ai_ge=result_ai_ge)[0]
+
+    def predict_many(self, texts: list[str], result_ai_ge=0.5) -> list[ModelPredictionDataclassProtocol]:
+        return self.predict_many_timed(texts, result_ai_ge=result_ai_ge)[0]
+
+    def predict_many_timed(
+        self,
+        texts: list[str],
+        result_ai_ge=0.5
+    ) -> tuple[list[ModelPredictionDataclassProtocol], dict[str, float]]:
+        if self.cheap is None or self.heavy is None:
+            raise ModelNotDefinedError
+
+        predictions, cheap_timings = self.cheap.predict_many_timed(texts, result_ai_ge=result_ai_ge)
+        timings = {f"cheap_{stage}": seconds for stage, seconds in cheap_timings.items()}
+
+        low, high = self.uncertainty_band
+        escalated = [
+            i for i, prediction in enumerate(predictions)
+            if low <= prediction.probability_ai <= high
+        ]
+
+        if escalated:
+            heavy_predictions, heavy_timings = self.heavy.predict_many_timed(
+                [texts[i] for i in escalated],
+                result_ai_ge=result_ai_ge
+            )
+            timings.update({f"heavy_{stage}": seconds for stage, seconds in heavy_timings.items()})
+
+            predictions = list(predictions)
+            for i, prediction in zip(escalated, heavy_predictions):
+                predictions[i] = prediction
+
+        with self._lock:
+            self._texts += len(texts)
+            self._escalated += len(escalated)
+
+        return predictions, timings
@@ -34,7 +34,8 @@ class WCMSLModel(BaseModelMixin):
         max_iter: int = 1000,
         n_jobs: int = -1,
         random_state: int = 42,
-        sparse_threshold: float = 0.3
+        sparse_threshold: float = 0.3,
+        metrics_n_jobs: int | None = None
     ) -> Pipeline | None:
         if model is not None:
             self.model = model
@@ -61,7 +62,7 @@ class WCMSLModel(BaseModelMixin):
                     (
                         "metrics",
                         Pipeline([
-                            ("metrics", TextMetricsTransformer()),
+                            ("metrics", TextMetricsTransformer(n_jobs=metrics_n_jobs)),
                             ("scaler", StandardScaler())
                         ]),
                         "text"
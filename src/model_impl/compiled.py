@@ -0,0 +1,258 @@
+import math
+import re
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.special import expit
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.pipeline import Pipeline
+
+from src.features.text_metrics import TextMetricCalculator
+from src.model_impl.timing import timed_stage
+from src.model_impl.artifact import (
+    LinearModelArtifact,
+    TfidfBlock,
+    MetricsBlock,
+    ngram_hashes
+)
+
+# Hash slots scanned at once for the n-grams whose home slot holds another term
+PROBE_WINDOW = 8
+
+# TfidfVectorizer's char analyzer collapses each whitespace run to one space before slicing n-grams
+WHITESPACE_RUNS = re.compile(r"\s\s+")
+
+
+class NgramWeightTable:
+    """Maps every n-gram of one TF-IDF block to its idf and folded idf * coef weight"""
+
+
+    def __init__(self, block: TfidfBlock, coef: np.ndarray) -> None:
+        columns = np.asarray(block.columns)
+
+        # Terms and hash slots stay memory-mapped, so every worker shares the same pages
+        # instead of building its own dict of the vocabulary
+        self.terms = np.asarray(block.terms)
+        self.slots = np.asarray(block.slots)
+        self.idf = np.asarray(block.idf)[columns] if block.params["use_idf"] else np.ones(len(columns))
+        self.weighted = self.idf * np.asarray(coef)[columns]
+
+        self._window = np.arange(1, PROBE_WINDOW + 1)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def rows(self, ngrams: np.ndarray) -> np.ndarray:
+        """Returns the table row of every n-gram (utf-8 bytes), or -1 for n-grams outside the vocabulary"""
+        mask = len(self.slots) - 1
+        positions = (ngram_hashes(ngrams) & np.uint64(mask)).astype(np.intp)
+
+        # The table is at most a quarter full, so the home slot settles most n-grams: a free slot
+        # means an unknown n-gram, a slot holding the same bytes gives its row
+        candidates = self.slots[positions]
+        matched = (candidates >= 0) & (self.terms[candidates] == ngrams)
+        rows = np.where(matched, candidates, -1)
+
+        # The few others scan the next PROBE_WINDOW slots of their probe run at once, which nearly always reaches
+        # the n-gram or a free slot
+        pending = np.flatnonzero((candidates >= 0) & ~matched)
+        positions = positions[pending]
+        while len(pending):
+            candidates = self.slots[(positions[:, None] + self._window) & mask]
+            occupied = candidates >= 0
+            matched = occupied & (self.terms[candidates] == ngrams[pending, None])
+
+            found = matched.any(axis=1)
+            rows[pending[found]] = candidates[matched]
+
+            probing = ~found & occupied.all(axis=1)
+            pending = pending[probing]
+            positions = positions[probing] + PROBE_WINDOW
+
+        return rows
+
+
+class CharNgramEncoder:
+    """Slices the char n-grams of an ASCII text as windows of its bytes, without a str per n-gram"""
+
+
+    def __init__(self, params: dict) -> None:
+        vectorizer = TfidfVectorizer(**params)
+        self.decode = vectorizer.decode
+        self.preprocess = vectorizer.build_preprocessor()
+        self.min_n, self.max_n = params["ngram_range"]
+        self.width = -(-self.max_n // 8) * 8
+
+    def __call__(self, text: str) -> np.ndarray | None:
+        """Returns the utf-8 bytes of every n-gram the char analyzer yields, or None for non-ASCII text"""
+        document = WHITESPACE_RUNS.sub(" ", self.preprocess(self.decode(text)))
+
+        # Only in ASCII text is every char a single byte
+        if not document.isascii():
+            return None
+
+        chars = np.frombuffer(document.encode("ascii"), dtype=np.uint8)
+        sizes = range(self.min_n, min(self.max_n, len(chars)) + 1)
+
+        # One zero-padded row per n-gram, n-gram sizes one after another as the analyzer yields them
+        windows = np.zeros((sum(len(chars) - n + 1 for n in sizes), self.width), dtype=np.uint8)
+        start = 0
+        for n in sizes:
+            windows[start:start + len(chars) - n + 1, :n] = sliding_window_view(chars, n)
+            start += len(chars) - n + 1
+
+        return windows.view(f"S{self.width}").ravel()
+
+
+class CompiledTfidfBlock:
+    """Scores one TF-IDF block with a single vectorised hash lookup for all n-grams of a batch"""
+
+
+    def __init__(self, block: TfidfBlock, coef: np.ndarray) -> None:
+        self.name = block.name
+        self.analyzer: Callable[[str], list[str]] = TfidfVectorizer(**block.params).build_analyzer()
+        self.char_ngrams = CharNgramEncoder(block.params) if block.params["analyzer"] == "char" else None
+        self.table = NgramWeightTable(block, coef)
+
+        self.binary = block.params["binary"]
+        self.sublinear_tf = block.params["sublinear_tf"]
+        self.norm = block.params["norm"]
+
+    def encoded_ngrams(self, text: str) -> np.ndarray:
+        if self.char_ngrams is not None:
+            encoded = self.char_ngrams(text)
+            if encoded is not None:
+                return encoded
+
+        return np.array([ngram.encode("utf-8") for ngram in self.analyzer(text)], dtype=np.bytes_)
+
+    def _tf(self, counts: np.ndarray) -> np.ndarray:
+        if self.binary:
+            return np.ones(len(counts))
+        if self.sublinear_tf:
+            return np.log(counts) + 1.0
+        return counts.astype(float)
+
+    def decision(self, text: str) -> float:
+        rows = self.table.rows(self.encoded_ngrams(text)) if len(self.table) else np.empty(0, dtype=np.intp)
+        rows, counts = np.unique(rows[rows >= 0], return_counts=True)
+
+        if len(rows) == 0:
+            return 0.0
+
+        tf = self._tf(counts)
+        values = tf * self.table.idf[rows]
+
+        if self.norm == "l2":
+            norm = math.sqrt(values @ values)
+        elif self.norm == "l1":
+            norm = float(np.abs(values).sum())
+        else:
+            norm = 1.0
+
+        if norm == 0.0:
+            return 0.0
+
+        return float(tf @ self.table.weighted[rows]) / norm
+
+    def decisions(self, texts: list[str]) -> np.ndarray:
+        # A lone text, as in single requests, skips the per-batch bookkeeping
+        if len(texts) == 1:
+            return np.array([self.decision(texts[0])])
+
+        encoded = [self.encoded_ngrams(text) for text in texts]
+        lengths = np.fromiter(map(len, encoded), dtype=np.intp, count=len(texts))
+        scores = np.zeros(len(texts))
+
+        if lengths.sum() == 0 or len(self.table) == 0:
+            return scores
+
+        rows = self.table.rows(np.concatenate(encoded))
+        text_rows = np.repeat(np.arange(len(texts)), lengths)
+        known = rows >= 0
+
+        # Term counts of the batch as sorted (text, row) pairs
+        pairs, counts = np.unique(text_rows[known] * len(self.table) + rows[known], return_counts=True)
+        pair_texts = pairs // len(self.table)
+        pair_rows = pairs % len(self.table)
+
+        tf = self._tf(counts)
+        values = tf * self.table.idf[pair_rows]
+
+        if self.norm == "l2":
+            norms = np.sqrt(np.bincount(pair_texts, weights=values * values, minlength=len(texts)))
+        elif self.norm == "l1":
+            norms = np.bincount(pair_texts, weights=np.abs(values), minlength=len(texts))
+        else:
+            norms = np.ones(len(texts))
+
+        dots = np.bincount(pair_texts, weights=tf * self.table.weighted[pair_rows], minlength=len(texts))
+
+        # Texts without a known n-gram have a zero norm and score 0, as in the sparse pipeline
+        return np.divide(dots, norms, out=scores, where=norms > 0)
+
+
+class CompiledMetricsBlock:
+    """Scores the standardized stylometric metrics"""
+
+
+    def __init__(self, block: MetricsBlock, coef: np.ndarray) -> None:
+        self.name = block.name
+
+        # (x - mean) / scale . coef == x . (coef / scale) - mean . (coef / scale)
+        self.weights = np.asarray(coef) / np.asarray(block.scale)
+        self.offset = float(np.asarray(block.mean) @ self.weights)
+
+    def decision(self, text: str) -> float:
+        metrics = np.fromiter(
+            (value for _, value in TextMetricCalculator(text).all_metrics),
+            dtype=float,
+            count=len(self.weights)
+        )
+        return float(metrics @ self.weights) - self.offset
+
+    def decisions(self, texts: list[str]) -> np.ndarray:
+        return np.fromiter((self.decision(text) for text in texts), dtype=float, count=len(texts))
+
+
+class CompiledLinearModel:
+    """Lean sklearn-free scorer for TF-IDF/metrics + LogisticRegression pipelines"""
+
+
+    def __init__(self, artifact: LinearModelArtifact) -> None:
+        self.blocks: list[CompiledTfidfBlock | CompiledMetricsBlock] = []
+
+        offset = 0
+        for block in artifact.blocks:
+            coef = artifact.coef[offset:offset + block.n_features]
+            offset += block.n_features
+
+            if isinstance(block, TfidfBlock):
+                self.blocks.append(CompiledTfidfBlock(block, coef))
+            else:
+                self.blocks.append(CompiledMetricsBlock(block, coef))
+
+        self.intercept = float(artifact.intercept[0])
+
+    @classmethod
+    def compile(cls, pipeline: Pipeline) -> "CompiledLinearModel":
+        return cls(LinearModelArtifact.from_pipeline(pipeline))
+
+    @classmethod
+    def load(cls, artifact_path: Path) -> "CompiledLinearModel":
+        return cls(LinearModelArtifact.load(artifact_path))
+
+    def decision_function(self, text: str) -> float:
+        return self.intercept + sum(block.decision(text) for block in self.blocks)
+
+    def predict_proba_ai(self, texts: list[str], timings: dict[str, float] | None = None) -> np.ndarray:
+        # Block-major, so each block's share of the time can be reported; the sum order matches decision_function
+        scores = np.zeros(len(texts))
+        for block in self.blocks:
+            with timed_stage(timings, block.name):
+                scores += block.decisions(texts)
+
+        with timed_stage(timings, "clf"):
+            return expit(self.intercept + scores)
@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+
+from src.config.config import config
+from src.model_impl.base import ModelPredictionCounter
+
+
+class EmptyDocumentError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Segment:
+    start: int
+    end: int
+    text: str
+
+
+@dataclass(frozen=True)
+class SegmentPrediction:
+    start: int
+    end: int
+    probability_ai: float
+
+
+@dataclass(frozen=True)
+class DocumentPrediction:
+    result: Literal["HUMAN", "AI"]
+    probability_human: float
+    probability_ai: float
+    segments: list[SegmentPrediction]
+
+
+class DocumentSegmenter:
+    """Splits a text, fed piece by piece, into overlapping windows near the training text length"""
+
+
+    def __init__(
+        self,
+        min_length: int | None = None,
+        max_length: int | None = None,
+        overlap: int | None = None
+    ) -> None:
+        self.min_length = min_length or config.dataset_analyze.MIN_TEXT_LENGTH
+        self.max_length = max_length or config.dataset_analyze.MAX_TEXT_LENGTH
+        self.overlap = overlap if overlap is not None else config.document.SEGMENT_OVERLAP
+
+        if not 0 <= self.overlap < self.min_length <= self.max_length:
+            raise ValueError("Expected 0 <= overlap < min_length <= max_length")
+
+        self._buffer = ""
+        # Buffer index where the next window starts, and the document offset of buffer index 0
+        self._position = 0
+        self._offset = 0
+        # How many chars from the position on the last window already covered
+        self._covered = 0
+
+    def feed(self, text: str) -> list[Segment]:
+        self._buffer += text
+        segments = []
+
+        # One char past the window is needed to know whether the window ends on a word boundary
+        while len(self._buffer) - self._position > self.max_length:
+            end = self._window_end()
+            self._emit(end, segments)
+
+            start = self._next_start(end)
+            self._covered = end - start
+            self._position = start
+
+        # Dropping the scored prefix once per feed keeps a large feed linear in its length
+        self._offset += self._position
+        self._buffer = self._buffer[self._position:]
+        self._position = 0
+
+        return segments
+
+    def close(self) -> list[Segment]:
+        segments = []
+
+        # The tail is shorter than a full window; it is scored only if it holds text no window covered
+        if self._buffer[self._covered:].strip():
+            self._emit(len(self._buffer), segments)
+
+        self._offset += len(self._buffer)
+        self._buffer = ""
+        self._covered = 0
+
+        return segments
+
+    def _window_end(self) -> int:
+        for i in range(self._position + self.max_length, self._position + self.min_length - 1, -1):
+            if self._buffer[i].isspace():
+                return i
+
+        return self._position + self.max_length
+
+    def _next_start(self, end: int) -> int:
+        start = end - self.overlap
+        for i in range(start, end):
+            if self._buffer[i].isspace():
+                return i + 1
+
+        return start
+
+    def _emit(self, end: int, segments: list[Segment]) -> None:
+        text = self._buffer[self._position:end]
+        if text.strip():
+            segments.append(Segment(start=self._offset + self._position, end=self._offset + end, text=text))
+
+
+def split_document(text: str, **kwargs) -> list[Segment]:
+    segmenter = DocumentSegmenter(**kwargs)
+    return segmenter.feed(text) + segmenter.close()
+
+
+def aggregate_segments(segments: list[SegmentPrediction], result_ai_ge=0.5) -> DocumentPrediction:
+    if not segments:
+        raise EmptyDocumentError("The document contains no text")
+
+    # Weighted by length, so a short tail window counts less than the full windows
+    probability_ai = float(np.average(
+        [segment.probability_ai for segment in segments],
+        weights=[segment.end - segment.start for segment in segments]
+    ))
+    prediction = ModelPredictionCounter(probability_ai, result_ai_ge).prediction
+
+    return DocumentPrediction(
+        result=prediction.result,
+        probability_human=prediction.probability_human,
+        probability_ai=prediction.probability_ai,
+        segments=segments
+    )
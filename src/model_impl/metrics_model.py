@@ -28,13 +28,14 @@ class MSModel(BaseModelMixin):
         model: Pipeline | None = None, 
         max_iter: int = 1000,
         n_jobs: int = -1,
-        random_state: int = 42
+        random_state: int = 42,
+        metrics_n_jobs: int | None = None
     ) -> Pipeline | None:
         if model is not None:
             self.model = model
         else:
             preprocessor = Pipeline([
-                ("metrics", TextMetricsTransformer()),
+                ("metrics", TextMetricsTransformer(n_jobs=metrics_n_jobs)),
                 ("scaler", StandardScaler())
             ])
 
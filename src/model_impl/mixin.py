@@ -1,5 +1,7 @@
 from pandas import DataFrame
 import pandas as pd
+import numpy as np
+from scipy import sparse
 
 from pathlib import Path
 
@@ -14,14 +16,31 @@ from sklearn.metrics import (
     classification_report,
     confusion_matrix,
 )
-from sklearn.model_selection import GridSearchCV
-
-from src.features.text_metrics import TextMetricCalculator
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.base import clone
 
+from src.config.config import config
+from src.model_impl.artifact import LinearModelArtifact
 from src.model_impl.base import ModelNotDefinedError
+from src.model_impl.compiled import CompiledLinearModel
+from src.model_impl.document import (
+    DocumentPrediction,
+    SegmentPrediction,
+    aggregate_segments,
+    split_document
+)
 from src.model_impl.base import ModelPredictionDataclassProtocol
 from src.model_impl.base import ModelPerformance
 from src.model_impl.base import ModelPredictionCounter
+from src.model_impl.cache import model_fingerprint
+from src.model_impl.prefitted import PrefittedTransformer
+from src.model_impl.timing import timed_stage
+from src.model_impl.prefitted import unwrap_prefitted
+from src.features.feature_cache import FeatureCache
+from src.features.metrics_store import MetricsStore
+from src.features.text_metrics import TextMetricsTransformer
+from src.utils.dataset import load_dataset
 
 
 class BaseModelMixin:
@@ -29,11 +48,20 @@ class BaseModelMixin:
     
     def __init__(self) -> None:
         self.model = None
+        self.compiled: CompiledLinearModel | None = None
+        self.fingerprint: str | None = None
 
     def load(self, model_path: Path) -> None:
-        obj = joblib.load(model_path)
+        model_path = Path(model_path)
 
-        self.model = obj["model"]
+        if model_path.is_dir():
+            self.model = LinearModelArtifact.load(model_path).to_pipeline()
+        else:
+            obj = joblib.load(model_path)
+            self.model = obj["model"]
+
+        self.compiled = None
+        self.fingerprint = model_fingerprint(model_path)
 
     def save(self, path: Path) -> None:
         if self.model is None:
@@ -43,19 +71,118 @@ class BaseModelMixin:
             "model": self.model
         }, path)
 
-    def predict(self, text: str, result_ai_ge=0.5) -> ModelPredictionDataclassProtocol:
+    def export_artifact(self, path: Path) -> None:
         if self.model is None:
             raise ModelNotDefinedError
-        
-        style_metrics = vars(TextMetricCalculator(text).all_metrics)
-        sample_df = pd.DataFrame(
-            [{**{"text": text}, **style_metrics}]
+
+        LinearModelArtifact.from_pipeline(self.model).save(path)
+
+    def load_compiled(self, model_path: Path) -> None:
+        model_path = Path(model_path)
+
+        if model_path.is_dir():
+            self.compiled = CompiledLinearModel.load(model_path)
+        else:
+            self.compiled = CompiledLinearModel.compile(joblib.load(model_path)["model"])
+
+        self.model = None
+        self.fingerprint = model_fingerprint(model_path)
+
+    def compile(self) -> CompiledLinearModel:
+        if self.model is None:
+            raise ModelNotDefinedError
+
+        self.compiled = CompiledLinearModel.compile(self.model)
+        return self.compiled
+
+    def predict(self, text: str, result_ai_ge=0.5) -> ModelPredictionDataclassProtocol:
+        return self.predict_many([text], result_ai_ge=result_ai_ge)[0]
+
+    def predict_many(self, texts: list[str], result_ai_ge=0.5) -> list[ModelPredictionDataclassProtocol]:
+        return self.predict_many_timed(texts, result_ai_ge=result_ai_ge)[0]
+
+    def predict_document(self, text: str, result_ai_ge=0.5, batch_size: int | None = None) -> DocumentPrediction:
+        """Scores overlapping training-length windows of a text of any length and aggregates them"""
+        batch_size = batch_size or config.document.BATCH_SIZE
+        segments = split_document(text)
+
+        predictions = []
+        for i in range(0, len(segments), batch_size):
+            predictions += self.predict_many([segment.text for segment in segments[i:i + batch_size]])
+
+        return aggregate_segments([
+            SegmentPrediction(start=segment.start, end=segment.end, probability_ai=prediction.probability_ai)
+            for segment, prediction in zip(segments, predictions)
+        ], result_ai_ge=result_ai_ge)
+
+    def predict_many_timed(
+        self,
+        texts: list[str],
+        result_ai_ge=0.5
+    ) -> tuple[list[ModelPredictionDataclassProtocol], dict[str, float]]:
+        if self.model is None and self.compiled is None:
+            raise ModelNotDefinedError
+
+        timings: dict[str, float] = {}
+
+        if not texts:
+            return [], timings
+
+        probabilities_ai = self.predict_proba_ai(texts, timings)
+
+        predictions = [
+            ModelPredictionCounter(probability_ai, result_ai_ge).prediction
+            for probability_ai in probabilities_ai
+        ]
+
+        return predictions, timings
+
+    def predict_proba_ai(self, texts: list[str], timings: dict[str, float] | None = None) -> np.ndarray:
+        if self.model is None and self.compiled is None:
+            raise ModelNotDefinedError
+
+        if self.compiled is not None:
+            return self.compiled.predict_proba_ai(texts, timings)
+
+        return self._staged_predict_proba_ai(pd.DataFrame({"text": texts}), timings)
+
+    def _staged_predict_proba_ai(self, samples_df: DataFrame, timings: dict[str, float] | None) -> np.ndarray:
+        """predict_proba split into its feature blocks, so each block's time can be reported"""
+        features_name, features = self.model.steps[0]
+        clf = self.model.steps[-1][1]
+
+        staged = len(self.model.steps) == 2 and not (
+            isinstance(features, ColumnTransformer)
+            and any(transformer == "passthrough" for _, transformer, _ in features.transformers_)
         )
+        if not staged:
+            with timed_stage(timings, "model"):
+                return self.model.predict_proba(samples_df)[:, 1]
 
-        proba = self.model.predict_proba(sample_df)[0]
-        
-        probability_ai = proba[1]
-        return ModelPredictionCounter(probability_ai, result_ai_ge).prediction
+        if isinstance(features, ColumnTransformer):
+            matrices = [
+                self._timed_transform(name, transformer, samples_df[columns], timings)
+                for name, transformer, columns in features.transformers_
+                if transformer != "drop"
+            ]
+            with timed_stage(timings, "stack"):
+                matrix = self._stack_blocks(matrices, features.sparse_output_)
+        else:
+            matrix = self._timed_transform(features_name, features, samples_df, timings)
+
+        with timed_stage(timings, "clf"):
+            return clf.predict_proba(matrix)[:, 1]
+
+    @staticmethod
+    def _timed_transform(name: str, transformer, X, timings: dict[str, float] | None):
+        if isinstance(transformer, Pipeline):
+            for step_name, step in transformer.steps:
+                with timed_stage(timings, step_name):
+                    X = step.transform(X)
+            return X
+
+        with timed_stage(timings, name):
+            return transformer.transform(X)
 
     def train(
         self,
@@ -64,44 +191,19 @@ class BaseModelMixin:
         generated_col: str = "generated",
         test_size: float = 0.25,
         random_state: int | None = 42,
-        stratify: bool = True
+        stratify: bool = True,
+        chunk_size: int | None = None,
+        feature_cache: FeatureCache | None = None,
+        metrics_store: MetricsStore | None = None
     ) -> ModelPerformance:
-        if isinstance(dataset, Path):
-            df = pd.read_csv(dataset)
-            df = df.dropna(subset=[text_col, generated_col])
-
-            df[generated_col] = df[generated_col].astype(int)
-        
-        if isinstance(dataset, DataFrame):
-            df = dataset
-        
-        style_df = TextMetricCalculator.build_metrics_dataframe(df, text_col=text_col)
-
-        full_df = pd.concat(
-            [
-                df[[text_col, generated_col]].reset_index(drop=True),
-                style_df.reset_index(drop=True),
-            ],
-            axis=1,
-        )
-
-        X = full_df.drop(columns=[generated_col])
-        y = full_df[generated_col]
-
-        X_train, X_test, y_train, y_test = train_test_split(
-            X,
-            y,
-            test_size=test_size,
-            random_state=random_state,
-            stratify=y if stratify else None,
+        X_train, X_test, y_train, y_test = self._split_dataset(
+            dataset, text_col, generated_col, test_size, random_state, stratify, chunk_size
         )
 
         print("Training the model...")
-        self.model.fit(X_train, y_train)
+        y_pred = self._fit_and_predict(X_train, y_train, X_test, feature_cache, metrics_store)
         print("Evaluating the model...")
 
-        y_pred = self.model.predict(X_test)
-
         return ModelPerformance(
             accuracy=accuracy_score(y_test, y_pred),
             precision=precision_score(y_test, y_pred),
@@ -118,34 +220,77 @@ class BaseModelMixin:
         generated_col: str = "generated",
         test_size: float = 0.25,
         random_state: int | None = 42,
-        stratify: bool = True
+        stratify: bool = True,
+        chunk_size: int | None = None,
+        feature_cache: FeatureCache | None = None,
+        metrics_store: MetricsStore | None = None
     ) -> ModelPerformance:
         if self.model is None:
             raise ModelNotDefinedError
 
-        if isinstance(dataset, Path):
-            df = pd.read_csv(dataset)
-            df = df.dropna(subset=[text_col, generated_col])
+        X_train, X_test, y_train, y_test = self._split_dataset(
+            dataset, text_col, generated_col, test_size, random_state, stratify, chunk_size
+        )
 
-            df[generated_col] = df[generated_col].astype(int)
+        print("Fine-tuning the model...")
+        y_pred = self._fit_and_predict(X_train, y_train, X_test, feature_cache, metrics_store)
+        print("Evaluating the fine-tuned model...")
+
+        return ModelPerformance(
+            accuracy=accuracy_score(y_test, y_pred),
+            precision=precision_score(y_test, y_pred),
+            recall=recall_score(y_test, y_pred),
+            f1=f1_score(y_test, y_pred),
+            classification_report=classification_report(y_test, y_pred, target_names=["Human", "AI"]),
+            confusion_matrix=confusion_matrix(y_test, y_pred),
+        )
+
+    def warm_feature_cache(
+        self,
+        dataset: Path | DataFrame,
+        feature_cache: FeatureCache,
+        text_col: str = "text",
+        generated_col: str = "generated",
+        test_size: float = 0.25,
+        random_state: int | None = 42,
+        stratify: bool = True,
+        chunk_size: int | None = None,
+        metrics_store: MetricsStore | None = None
+    ) -> None:
+        if self.model is None:
+            raise ModelNotDefinedError
+
+        X_train, X_test, _, _ = self._split_dataset(
+            dataset, text_col, generated_col, test_size, random_state, stratify, chunk_size
+        )
+
+        self._attach_metrics_store(metrics_store)
+        try:
+            for _, transformer, columns in self._feature_blocks():
+                feature_cache.fit_transform(transformer, X_train[columns], X_test[columns])
+        finally:
+            self._attach_metrics_store(None)
+
+    def _split_dataset(
+        self,
+        dataset: Path | DataFrame,
+        text_col: str,
+        generated_col: str,
+        test_size: float,
+        random_state: int | None,
+        stratify: bool,
+        chunk_size: int | None
+    ):
+        if isinstance(dataset, Path):
+            df = load_dataset(dataset, text_col, generated_col, chunk_size)
         
         if isinstance(dataset, DataFrame):
             df = dataset
         
-        style_df = TextMetricCalculator.build_metrics_dataframe(df, text_col=text_col)
-
-        full_df = pd.concat(
-            [
-                df[[text_col, generated_col]].reset_index(drop=True),
-                style_df.reset_index(drop=True),
-            ],
-            axis=1,
-        )
+        X = df[[text_col]].rename(columns={text_col: "text"}).reset_index(drop=True)
+        y = df[generated_col].reset_index(drop=True)
 
-        X = full_df.drop(columns=[generated_col])
-        y = full_df[generated_col]
-
-        X_train, X_test, y_train, y_test = train_test_split(
+        return train_test_split(
             X,
             y,
             test_size=test_size,
@@ -153,19 +298,96 @@ class BaseModelMixin:
             stratify=y if stratify else None,
         )
 
-        print("Fine-tuning the model...")
-        self.model.fit(X_train, y_train)
-        print("Evaluating the fine-tuned model...")
+    def _feature_blocks(self) -> list[tuple]:
+        features = self.model.steps[0][1]
 
-        y_pred = self.model.predict(X_test)
+        if isinstance(features, ColumnTransformer):
+            return features.transformers
 
-        return ModelPerformance(
-            accuracy=accuracy_score(y_test, y_pred),
-            precision=precision_score(y_test, y_pred),
-            recall=recall_score(y_test, y_pred),
-            f1=f1_score(y_test, y_pred),
-            classification_report=classification_report(y_test, y_pred, target_names=["Human", "AI"]),
-            confusion_matrix=confusion_matrix(y_test, y_pred),
-        )
+        return [(self.model.steps[0][0], features, ["text"])]
+
+    def _attach_metrics_store(self, metrics_store: MetricsStore | None) -> None:
+        for estimator in self.model.get_params(deep=True).values():
+            if isinstance(estimator, TextMetricsTransformer):
+                estimator.store = metrics_store
+
+    def _fit_and_predict(
+        self,
+        X_train: DataFrame,
+        y_train,
+        X_test: DataFrame,
+        feature_cache: FeatureCache | None,
+        metrics_store: MetricsStore | None = None
+    ) -> np.ndarray:
+        self._attach_metrics_store(metrics_store)
+        try:
+            return self._fit_features_and_predict(X_train, y_train, X_test, feature_cache)
+        finally:
+            self._attach_metrics_store(None)
+
+    def _fit_features_and_predict(
+        self,
+        X_train: DataFrame,
+        y_train,
+        X_test: DataFrame,
+        feature_cache: FeatureCache | None
+    ) -> np.ndarray:
+        self.compiled = None
+
+        if feature_cache is None:
+            self.model.fit(X_train, y_train)
+            return self.model.predict(X_test)
+
+        blocks = [
+            (name, *feature_cache.fit_transform(transformer, X_train[columns], X_test[columns]), columns)
+            for name, transformer, columns in self._feature_blocks()
+        ]
+
+        features_name, features = self.model.steps[0]
+        if isinstance(features, ColumnTransformer):
+            fitted_features = clone(features)
+            fitted_features.transformers = [
+                (name, PrefittedTransformer(fitted), columns)
+                for name, fitted, _, _, columns in blocks
+            ]
+            fitted_features.fit(X_train.iloc[:1])
+            unwrap_prefitted(fitted_features)
+            fitted_features.transformers = features.transformers
+
+            train_matrices = [train for _, _, train, _, _ in blocks]
+            fitted_features.sparse_output_ = self._sparse_output(train_matrices, features.sparse_threshold)
+
+            train_matrix = self._stack_blocks(train_matrices, fitted_features.sparse_output_)
+            test_matrix = self._stack_blocks(
+                [test for _, _, _, test, _ in blocks], fitted_features.sparse_output_
+            )
+        else:
+            _, fitted_features, train_matrix, test_matrix, _ = blocks[0]
+
+        self.model.steps[0] = (features_name, fitted_features)
+
+        clf = self.model.steps[-1][1]
+        clf.fit(train_matrix, y_train)
+
+        return clf.predict(test_matrix)
+
+    @staticmethod
+    def _sparse_output(matrices: list, sparse_threshold: float) -> bool:
+        """ColumnTransformer's rule: stay sparse when any block is sparse and the stack is sparse enough"""
+        if not any(sparse.issparse(matrix) for matrix in matrices):
+            return False
+
+        nnz = sum(matrix.nnz if sparse.issparse(matrix) else matrix.size for matrix in matrices)
+        total = sum(matrix.shape[0] * matrix.shape[1] for matrix in matrices)
+
+        return nnz / total < sparse_threshold
 
+    @staticmethod
+    def _stack_blocks(matrices: list, sparse_output: bool):
+        if sparse_output:
+            return sparse.hstack(matrices).tocsr()
 
+        return np.hstack([
+            matrix.toarray() if sparse.issparse(matrix) else matrix
+            for matrix in matrices
+        ])
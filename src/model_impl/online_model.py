@@ -0,0 +1,215 @@
+from pathlib import Path
+
+import numpy as np
+from pandas import DataFrame
+
+from sklearn.base import clone
+from sklearn.pipeline import Pipeline
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.compose import ColumnTransformer
+from sklearn.model_selection import train_test_split
+from sklearn.utils.validation import check_is_fitted
+from sklearn.exceptions import NotFittedError
+from sklearn.metrics import (
+    accuracy_score,
+    precision_score,
+    recall_score,
+    f1_score,
+    classification_report,
+    confusion_matrix,
+)
+
+from src.model_impl.mixin import BaseModelMixin
+from src.model_impl.base import ModelNotDefinedError
+from src.model_impl.base import ModelPerformance
+from src.utils.dataset import iter_dataset_chunks
+from src.features.feature_cache import FeatureCache
+from src.features.metrics_store import MetricsStore
+
+
+CLASSES = np.array([0, 1])
+
+
+class HWCSModel(BaseModelMixin):
+    """Hashing-Word-Character-SGDClassifier Model, trained online with partial_fit"""
+
+
+    def __init__(self):
+        super().__init__()
+
+    def init_model(
+        self,
+        model: Pipeline | None = None,
+        word_ngram_range: tuple[int] = (1, 2),
+        word_n_features: int = 2 ** 20,
+        char_ngram_range: tuple[int] = (3, 5),
+        char_n_features: int = 2 ** 20,
+        alpha: float = 1e-5,
+        random_state: int = 42) -> Pipeline | None:
+        if model is not None:
+            self.model = model
+        else:
+            word_hashing = HashingVectorizer(
+                analyzer="word",
+                ngram_range=word_ngram_range,
+                n_features=word_n_features,
+                alternate_sign=False,
+                lowercase=True,
+            )
+
+            char_hashing = HashingVectorizer(
+                analyzer="char",
+                ngram_range=char_ngram_range,
+                n_features=char_n_features,
+                alternate_sign=False,
+            )
+
+            preprocessor = ColumnTransformer(
+                transformers=[
+                    ("word_hashing", word_hashing, "text"),
+                    ("char_hashing", char_hashing, "text"),
+                ]
+            )
+
+            sgd = SGDClassifier(
+                loss="log_loss",
+                alpha=alpha,
+                random_state=random_state,
+            )
+
+            pipeline = Pipeline(
+                steps=[
+                    ("features", preprocessor),
+                    ("clf", sgd)
+                ]
+            )
+
+            self.model = pipeline
+
+        return self.model
+
+    def partial_fit(self, texts: DataFrame, y) -> None:
+        """Folds one labeled mini-batch into the model without refitting on earlier data"""
+        if self.model is None:
+            raise ModelNotDefinedError
+
+        features = self.model.named_steps["features"]
+        try:
+            check_is_fitted(features)
+        except NotFittedError:
+            # Hashing vectorizers are stateless: fitting only records the input columns
+            features.fit(texts)
+
+        self.compiled = None
+        self.model.named_steps["clf"].partial_fit(features.transform(texts), y, classes=CLASSES)
+
+    def train(
+        self,
+        dataset: Path | DataFrame,
+        text_col: str = "text",
+        generated_col: str = "generated",
+        test_size: float = 0.25,
+        random_state: int | None = 42,
+        stratify: bool = True,
+        chunk_size: int | None = None,
+        epochs: int = 1,
+        feature_cache: FeatureCache | None = None,
+        metrics_store: MetricsStore | None = None
+    ) -> ModelPerformance:
+        # Start from scratch, keeping the settings given to init_model
+        if self.model is None:
+            self.init_model()
+        else:
+            self.model = clone(self.model)
+
+        print("Training the model online...")
+        return self._fit_stream(dataset, text_col, generated_col, test_size, random_state, stratify, chunk_size, epochs)
+
+    def finetune(
+        self,
+        dataset: Path | DataFrame,
+        text_col: str = "text",
+        generated_col: str = "generated",
+        test_size: float = 0.25,
+        random_state: int | None = 42,
+        stratify: bool = True,
+        chunk_size: int | None = None,
+        epochs: int = 1,
+        feature_cache: FeatureCache | None = None,
+        metrics_store: MetricsStore | None = None
+    ) -> ModelPerformance:
+        if self.model is None:
+            raise ModelNotDefinedError
+
+        print("Fine-tuning the model online...")
+        return self._fit_stream(dataset, text_col, generated_col, test_size, random_state, stratify, chunk_size, epochs)
+
+    def warm_feature_cache(self, *args, **kwargs) -> None:
+        # Hashed features are stateless and produced per mini-batch, so there is nothing to cache
+        pass
+
+    def _iter_batches(
+        self,
+        dataset: Path | DataFrame,
+        text_col: str,
+        generated_col: str,
+        chunk_size: int | None,
+    ):
+        if isinstance(dataset, DataFrame):
+            df = dataset.dropna(subset=[text_col, generated_col])
+            step = chunk_size or len(df) or 1
+            for start in range(0, len(df), step):
+                yield df.iloc[start:start + step]
+        else:
+            yield from iter_dataset_chunks(dataset, text_col, generated_col, chunk_size)
+
+    def _fit_stream(
+        self,
+        dataset: Path | DataFrame,
+        text_col: str,
+        generated_col: str,
+        test_size: float,
+        random_state: int | None,
+        stratify: bool,
+        chunk_size: int | None,
+        epochs: int,
+    ) -> ModelPerformance:
+        y_test_batches = []
+        y_pred_batches = []
+
+        for epoch in range(epochs):
+            is_last_epoch = epoch == epochs - 1
+
+            for chunk in self._iter_batches(dataset, text_col, generated_col, chunk_size):
+                X = chunk[[text_col]].rename(columns={text_col: "text"}).reset_index(drop=True)
+                y = chunk[generated_col].astype(int).reset_index(drop=True)
+
+                # The held-out part of every chunk is the same in each epoch, so it is never trained on
+                X_train, X_test, y_train, y_test = train_test_split(
+                    X,
+                    y,
+                    test_size=test_size,
+                    random_state=random_state,
+                    stratify=y if stratify and y.nunique() > 1 else None,
+                )
+
+                self.partial_fit(X_train, y_train)
+
+                if is_last_epoch:
+                    y_test_batches.append(y_test.to_numpy())
+                    y_pred_batches.append(self.model.predict(X_test))
+
+        print("Evaluating the model...")
+
+        y_test = np.concatenate(y_test_batches)
+        y_pred = np.concatenate(y_pred_batches)
+
+        return ModelPerformance(
+            accuracy=accuracy_score(y_test, y_pred),
+            precision=precision_score(y_test, y_pred),
+            recall=recall_score(y_test, y_pred),
+            f1=f1_score(y_test, y_pred),
+            classification_report=classification_report(y_test, y_pred, target_names=["Human", "AI"]),
+            confusion_matrix=confusion_matrix(y_test, y_pred),
+        )
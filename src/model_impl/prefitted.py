@@ -0,0 +1,33 @@
+from sklearn.base import (
+    BaseEstimator,
+    TransformerMixin
+)
+
+
+class PrefittedTransformer(BaseEstimator, TransformerMixin):
+    """Exposes an already fitted transformer to meta-estimators without refitting it"""
+
+
+    def __init__(self, transformer) -> None:
+        self.transformer = transformer
+
+    def __sklearn_clone__(self):
+        return self
+
+    def fit(self, X, y=None):
+        return self
+
+    def transform(self, X):
+        return self.transformer.transform(X)
+
+
+def unwrap_prefitted(column_transformer) -> None:
+    """Replaces fitted PrefittedTransformer entries with the transformers they wrap"""
+    column_transformer.transformers_ = [
+        (
+            name,
+            transformer.transformer if isinstance(transformer, PrefittedTransformer) else transformer,
+            columns
+        )
+        for name, transformer, columns in column_transformer.transformers_
+    ]
@@ -0,0 +1,13 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def timed_stage(timings: dict[str, float] | None, stage: str) -> Iterator[None]:
+    """Adds the wall time of the block to timings[stage]; a no-op bookkeeping-wise when timings is None"""
+    start = time.perf_counter()
+    yield
+
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
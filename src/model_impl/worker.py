@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from src.model_impl.wrapper import ModelWrapper
+
+# The model of the current pool worker process, set once by the pool initializer
+_worker_model: ModelWrapper | None = None
+
+
+def load_worker_model(model_path: Path, compiled: bool) -> None:
+    global _worker_model
+
+    _worker_model = ModelWrapper()
+    if compiled:
+        _worker_model.load_compiled(model_path)
+    else:
+        _worker_model.load(model_path)
+
+
+def worker_model() -> ModelWrapper:
+    if _worker_model is None:
+        raise RuntimeError("No model loaded in this process; use load_worker_model as the pool initializer")
+
+    return _worker_model
@@ -13,6 +13,11 @@ class ModelWrapper(BaseModelMixin):
             "ModelWrapper is inference-only: saving is disabled"
         )
 
+    def export_artifact(self, *args, **kwargs) -> None:
+        raise RuntimeError(
+            "ModelWrapper is inference-only: exporting is disabled"
+        )
+
     def train(self, *args, **kwargs) -> None:
         raise RuntimeError(
             "ModelWrapper is inference-only: training is disabled"
@@ -0,0 +1,255 @@
+import argparse
+import importlib.util
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait
+)
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from src.config.config import config
+from src.model_impl.cache import model_fingerprint
+from src.model_impl.worker import (
+    load_worker_model,
+    worker_model
+)
+
+OUTPUT_FORMATS = ("parquet", "csv")
+# The engines pandas tries for engine="auto"
+PARQUET_ENGINES = ("pyarrow", "fastparquet")
+
+
+class CheckpointMismatchError(Exception):
+    pass
+
+class ParquetEngineMissingError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ScoringReport:
+    rows_scored: int
+    rows_skipped: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_scored / self.seconds if self.seconds else 0.0
+
+
+def iter_input_chunks(
+    input_path: Path,
+    text_col: str,
+    id_col: str | None,
+    chunk_size: int
+) -> Iterator[DataFrame]:
+    columns = [text_col] + ([id_col] if id_col else [])
+    suffix = input_path.suffix.lower()
+
+    if suffix == ".csv":
+        reader = pd.read_csv(input_path, usecols=columns, dtype=object, chunksize=chunk_size)
+    elif suffix in (".jsonl", ".ndjson"):
+        reader = pd.read_json(input_path, lines=True, dtype=False, chunksize=chunk_size)
+    else:
+        raise ValueError(f"Unsupported input format: {input_path.suffix} (expected .csv or .jsonl)")
+
+    with reader:
+        for chunk in reader:
+            yield chunk[columns]
+
+
+class ScoringCheckpoint:
+    """Run parameters plus one output part per finished chunk; a part only appears once fully written"""
+
+
+    def __init__(self, output_dir: Path, output_format: str, manifest: dict) -> None:
+        self.output_dir = Path(output_dir)
+        self.output_format = output_format
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        manifest_path = self.output_dir / "_manifest.json"
+        if manifest_path.exists():
+            existing = json.loads(manifest_path.read_text())
+            if existing != manifest:
+                raise CheckpointMismatchError(
+                    f"{self.output_dir} holds a run with other parameters or input; use a new output directory"
+                )
+        else:
+            write_atomic(manifest_path, lambda path: path.write_text(json.dumps(manifest, indent=2)))
+
+        # Leftovers of chunks that were being written when the previous run stopped
+        for tmp in self.output_dir.glob(".part-*.tmp"):
+            tmp.unlink()
+
+        self.done = {
+            int(path.stem.removeprefix("part-"))
+            for path in self.output_dir.glob(f"part-*.{output_format}")
+        }
+
+    def part_path(self, chunk_index: int) -> Path:
+        return self.output_dir / f"part-{chunk_index:06d}.{self.output_format}"
+
+
+def write_atomic(path: Path, write) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _score_chunk(
+    first_row: int,
+    texts: list[str],
+    ids: list | None,
+    id_col: str | None,
+    part_path: Path,
+    output_format: str
+) -> int:
+    # The worker writes its own part, so only a row count travels back to the parent
+    probabilities_ai = worker_model().predict_proba_ai(texts)
+
+    result = DataFrame({"row": np.arange(first_row, first_row + len(texts))})
+    if id_col:
+        result[id_col] = ids
+    result["probability_ai"] = probabilities_ai
+    result["result"] = np.where(probabilities_ai >= 0.5, "AI", "HUMAN")
+
+    if output_format == "parquet":
+        write_atomic(part_path, lambda path: result.to_parquet(path, index=False))
+    else:
+        write_atomic(part_path, lambda path: result.to_csv(path, index=False))
+
+    return len(result)
+
+
+def score_file(
+    input_path: Path,
+    output_dir: Path,
+    model_path: Path,
+    text_col: str = "text",
+    id_col: str | None = None,
+    output_format: str = "parquet",
+    chunk_size: int | None = None,
+    workers: int | None = None,
+    compiled: bool = False
+) -> ScoringReport:
+    """Scores a CSV/JSONL corpus chunk by chunk across worker processes, resuming from finished parts"""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format}")
+
+    # Checked here, since the workers would otherwise only fail on their first write
+    if output_format == "parquet" and not any(importlib.util.find_spec(engine) for engine in PARQUET_ENGINES):
+        raise ParquetEngineMissingError(
+            f"Parquet output needs one of {', '.join(PARQUET_ENGINES)}; install one or use --format csv"
+        )
+
+    input_path = Path(input_path)
+    chunk_size = chunk_size or config.scoring.CHUNK_SIZE
+    workers = workers or config.scoring.WORKERS
+
+    stat = input_path.stat()
+    checkpoint = ScoringCheckpoint(output_dir, output_format, {
+        "input": str(input_path.resolve()),
+        "input_size": stat.st_size,
+        "input_mtime_ns": stat.st_mtime_ns,
+        "text_col": text_col,
+        "id_col": id_col,
+        "chunk_size": chunk_size,
+        "output_format": output_format,
+        "model_fingerprint": model_fingerprint(model_path),
+    })
+
+    rows_scored = 0
+    rows_skipped = 0
+    start = time.perf_counter()
+
+    def collect(finished: set[Future]) -> None:
+        nonlocal rows_scored
+        for future in finished:
+            rows_scored += future.result()
+
+        elapsed = time.perf_counter() - start
+        print(f"{rows_scored} rows scored in {elapsed:.1f}s ({rows_scored / elapsed:.0f} rows/s)")
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=load_worker_model,
+        initargs=(model_path, compiled)
+    ) as pool:
+        in_flight: set[Future] = set()
+        first_row = 0
+
+        for chunk_index, chunk in enumerate(iter_input_chunks(input_path, text_col, id_col, chunk_size)):
+            if chunk_index in checkpoint.done:
+                rows_skipped += len(chunk)
+                first_row += len(chunk)
+                continue
+
+            # Bounded read-ahead keeps memory flat however large the input is
+            if len(in_flight) >= 2 * workers:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(finished)
+
+            in_flight.add(pool.submit(
+                _score_chunk,
+                first_row,
+                chunk[text_col].fillna("").astype(str).tolist(),
+                chunk[id_col].tolist() if id_col else None,
+                id_col,
+                checkpoint.part_path(chunk_index),
+                output_format
+            ))
+            first_row += len(chunk)
+
+        if in_flight:
+            collect(wait(in_flight).done)
+
+    return ScoringReport(
+        rows_scored=rows_scored,
+        rows_skipped=rows_skipped,
+        seconds=time.perf_counter() - start
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a CSV/JSONL corpus in chunks across worker processes.")
+    parser.add_argument("input", type=Path, help="Input .csv or .jsonl file.")
+    parser.add_argument("output_dir", type=Path, help="Directory for the output parts; rerun to resume.")
+    parser.add_argument("--model", type=Path, default=config.server.MODEL_PATH, help="Model pickle or artifact.")
+    parser.add_argument("--text-col", default="text")
+    parser.add_argument("--id-col", default=None, help="Column copied to the output next to the row number.")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="parquet")
+    parser.add_argument("--chunk-size", type=int, default=config.scoring.CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=config.scoring.WORKERS)
+    parser.add_argument("--compiled", action="store_true", help="Score with the compiled linear model.")
+    args = parser.parse_args()
+
+    report = score_file(
+        args.input,
+        args.output_dir,
+        args.model,
+        text_col=args.text_col,
+        id_col=args.id_col,
+        output_format=args.format,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        compiled=args.compiled
+    )
+
+    print(
+        f"Scored {report.rows_scored} rows in {report.seconds:.1f}s ({report.rows_per_second:.0f} rows/s); "
+        f"{report.rows_skipped} rows were already scored"
+    )
+
+
+if __name__ == "__main__":
+    main()
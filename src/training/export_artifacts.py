@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from src.model_impl.artifact import UnsupportedModelError
+from src.model_impl.mixin import BaseModelMixin
+
+
+def main():
+    models_dir = Path("src") / "models"
+
+    for model_path in sorted(models_dir.glob("*.pkl")):
+        model = BaseModelMixin()
+        model.load(model_path)
+
+        artifact_path = model_path.with_suffix(".artifact")
+        try:
+            model.export_artifact(artifact_path)
+        except UnsupportedModelError as exc:
+            print(f"Skipped {model_path.name}: {exc}")
+            continue
+
+        print(f"Exported {model_path.name} -> {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
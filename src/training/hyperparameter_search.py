@@ -0,0 +1,251 @@
+import json
+import math
+import os
+import time
+from dataclasses import (
+    dataclass,
+    asdict
+)
+from pathlib import Path
+from typing import Type
+
+import joblib
+from joblib import Parallel, delayed
+from pandas import DataFrame
+from sklearn.model_selection import ParameterGrid
+
+from src.features.feature_cache import FeatureCache
+from src.features.metrics_store import MetricsStore
+from src.model_impl.combined_model import WCMSLModel
+from src.model_impl.metrics_model import MSModel
+from src.model_impl.word_character import WCLModel
+from src.utils.dataset import load_dataset
+
+
+SEARCH_SPACES: dict[Type, dict[str, list]] = {
+    WCMSLModel: {
+        "word_ngram_range": [(1, 1), (1, 2)],
+        "word_max_features": [20_000, 40_000],
+        "min_df": [2, 5],
+        "char_ngram_range": [(3, 5), (2, 6)],
+        "char_max_features": [30_000, 60_000],
+    },
+    WCLModel: {
+        "word_ngram_range": [(1, 1), (1, 2)],
+        "word_max_features": [20_000, 40_000],
+        "min_df": [2, 5],
+        "char_ngram_range": [(3, 5), (3, 7)],
+        "char_max_features": [30_000, 60_000],
+    },
+    MSModel: {
+        "max_iter": [1000, 2000],
+    },
+}
+
+
+@dataclass(frozen=True)
+class Candidate:
+    model_cls: Type
+    init_kwargs: dict
+
+    @property
+    def candidate_id(self) -> str:
+        return joblib.hash((self.model_cls.__name__, sorted(self.init_kwargs.items())))
+
+
+@dataclass(frozen=True)
+class Trial:
+    candidate_id: str
+    model: str
+    init_kwargs: dict
+    rung: int
+    n_samples: int
+    f1: float
+    accuracy: float
+    fit_seconds: float
+
+
+class CheckpointMismatchError(Exception):
+    pass
+
+
+def build_candidates(search_spaces: dict[Type, dict[str, list]]) -> list[Candidate]:
+    return [
+        Candidate(model_cls=model_cls, init_kwargs=init_kwargs)
+        for model_cls, space in search_spaces.items()
+        for init_kwargs in ParameterGrid(space)
+    ]
+
+
+class TrialCheckpoint:
+    """Append-only JSON-lines record of finished trials behind a header of the search parameters, read back on restart"""
+
+
+    def __init__(self, path: Path, header: dict) -> None:
+        self.path = Path(path)
+        self.header = header
+        self.trials: dict[tuple[int, str], Trial] = {}
+
+        if not self.path.exists():
+            self._write()
+            return
+
+        with self.path.open() as f:
+            try:
+                existing = json.loads(f.readline())["header"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                existing = None
+
+            # Trials only resume a search over the same data, subsets and shuffle
+            if existing != header:
+                raise CheckpointMismatchError(
+                    f"{self.path} holds trials of a search with other parameters or data; use a new path"
+                )
+
+            truncated = False
+            for line in f:
+                # A crash mid-write leaves at most one truncated last line
+                try:
+                    trial = Trial(**json.loads(line))
+                except (json.JSONDecodeError, TypeError):
+                    truncated = True
+                    continue
+                self.trials[(trial.rung, trial.candidate_id)] = trial
+
+        if truncated:
+            # Rewrite without the partial line so new records start on a clean line
+            self._write()
+
+    def _write(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        with tmp.open("w") as f:
+            f.write(json.dumps({"header": self.header}) + "\n")
+            f.writelines(json.dumps(asdict(trial)) + "\n" for trial in self.trials.values())
+        os.replace(tmp, self.path)
+
+    def get(self, rung: int, candidate: Candidate) -> Trial | None:
+        return self.trials.get((rung, candidate.candidate_id))
+
+    def record(self, trial: Trial) -> None:
+        with self.path.open("a") as f:
+            f.write(json.dumps(asdict(trial)) + "\n")
+            f.flush()
+
+        self.trials[(trial.rung, trial.candidate_id)] = trial
+
+
+def run_trial(
+    candidate: Candidate,
+    subset: DataFrame,
+    rung: int,
+    feature_cache_dir: Path,
+    metrics_store_dir: Path,
+) -> Trial:
+    model = candidate.model_cls()
+    model.init_model(**candidate.init_kwargs)
+
+    start = time.perf_counter()
+    performance = model.train(
+        subset,
+        feature_cache=FeatureCache(feature_cache_dir),
+        metrics_store=MetricsStore(metrics_store_dir),
+    )
+
+    return Trial(
+        candidate_id=candidate.candidate_id,
+        model=candidate.model_cls.__name__,
+        init_kwargs=candidate.init_kwargs,
+        rung=rung,
+        n_samples=len(subset),
+        f1=float(performance.f1),
+        accuracy=float(performance.accuracy),
+        fit_seconds=time.perf_counter() - start,
+    )
+
+
+def successive_halving(
+    candidates: list[Candidate],
+    dataset: DataFrame,
+    checkpoint_path: Path,
+    feature_cache_dir: Path,
+    metrics_store_dir: Path,
+    factor: int = 3,
+    min_samples: int | None = None,
+    n_jobs: int = 3,
+    random_state: int = 42,
+) -> list[Trial]:
+    """Scores all candidates on a small subset, keeps the best 1/factor, and grows the subset by factor"""
+    n_rungs = max(1, math.ceil(math.log(len(candidates), factor)))
+    min_samples = min_samples or max(1, len(dataset) // factor ** (n_rungs - 1))
+    rung_sizes = [min(len(dataset), min_samples * factor ** rung) for rung in range(n_rungs)]
+
+    checkpoint = TrialCheckpoint(checkpoint_path, {
+        "dataset_fingerprint": joblib.hash(dataset),
+        "rung_sizes": rung_sizes,
+        "factor": factor,
+        "random_state": random_state,
+    })
+
+    # One fixed shuffle, so every rung trains on a superset of the previous one
+    shuffled = dataset.sample(frac=1.0, random_state=random_state).reset_index(drop=True)
+
+    survivors = candidates
+    trials: list[Trial] = []
+
+    for rung, rung_size in enumerate(rung_sizes):
+        subset = shuffled.iloc[:rung_size]
+        print(f"Rung {rung}: {len(survivors)} candidates on {len(subset)} samples")
+
+        pending = [candidate for candidate in survivors if checkpoint.get(rung, candidate) is None]
+
+        # Distinct feature blocks are extracted once, sequentially, before the parallel fits
+        feature_cache = FeatureCache(feature_cache_dir)
+        metrics_store = MetricsStore(metrics_store_dir)
+        for candidate in pending:
+            model = candidate.model_cls()
+            model.init_model(**candidate.init_kwargs)
+            model.warm_feature_cache(subset, feature_cache, metrics_store=metrics_store)
+
+        finished = Parallel(n_jobs=n_jobs, backend="loky", return_as="generator_unordered")(
+            delayed(run_trial)(candidate, subset, rung, feature_cache_dir, metrics_store_dir)
+            for candidate in pending
+        )
+        for trial in finished:
+            checkpoint.record(trial)
+
+        rung_trials = sorted(
+            (checkpoint.get(rung, candidate) for candidate in survivors),
+            key=lambda trial: trial.f1,
+            reverse=True,
+        )
+        trials.extend(rung_trials)
+
+        best_ids = {trial.candidate_id for trial in rung_trials[:max(1, math.ceil(len(survivors) / factor))]}
+        survivors = [candidate for candidate in survivors if candidate.candidate_id in best_ids]
+
+    return trials
+
+
+def main():
+    dataset_path = Path("data") / "raw" / "Test_AI_Human.csv"
+    search_dir = Path("data") / "search"
+
+    candidates = build_candidates(SEARCH_SPACES)
+
+    trials = successive_halving(
+        candidates,
+        load_dataset(dataset_path),
+        search_dir / "trials.jsonl",
+        feature_cache_dir=Path("data") / "feature_cache",
+        metrics_store_dir=Path("data") / "metrics_store",
+    )
+
+    final_rung = max(trial.rung for trial in trials)
+    for trial in (trial for trial in trials if trial.rung == final_rung):
+        print(f"{trial.f1:.4f}  {trial.model}  {trial.init_kwargs}")
+
+
+if __name__ == "__main__":
+    main()
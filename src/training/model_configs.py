@@ -4,6 +4,7 @@ from typing import Type
 from src.model_impl.combined_model import WCMSLModel
 from src.model_impl.metrics_model import MSModel
 from src.model_impl.word_character import WCLModel
+from src.model_impl.online_model import HWCSModel
 
 
 @dataclass
@@ -86,5 +87,14 @@ MODEL_CONFIGS = [
             "max_iter": 2000
         }
     ),
-]
 
+    # HWCS Online
+    # Stateless hashed word and character n-grams with an SGD classifier.
+    # Trained in streaming mini-batches, so it can be fine-tuned
+    # incrementally on new labeled data without a full refit.
+    ModelConfig(
+        name="hwcs_online",
+        model_cls=HWCSModel,
+        init_kwargs={}
+    ),
+]
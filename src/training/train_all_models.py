@@ -3,15 +3,37 @@ import sys
 from pathlib import Path
 from joblib import Parallel, delayed
 
+from src.features.feature_cache import FeatureCache
+from src.features.metrics_store import MetricsStore
 from src.training.model_configs import MODEL_CONFIGS
 from src.training.train_one import train_single_model
+from src.utils.dataset import load_dataset
 
 # PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+def warm_feature_cache(dataset_path: Path, feature_cache_dir: Path, metrics_store_dir: Path) -> None:
+    """Extracts every distinct feature block once, before the configs are fitted in parallel"""
+    dataset = load_dataset(dataset_path)
+    feature_cache = FeatureCache(feature_cache_dir)
+    metrics_store = MetricsStore(metrics_store_dir)
+
+    for config in MODEL_CONFIGS:
+        model = config.model_cls()
+        model.init_model(**config.init_kwargs)
+        model.warm_feature_cache(dataset, feature_cache, metrics_store=metrics_store)
+
+    stats = feature_cache.stats()
+    print(f"Feature cache: {stats.misses} blocks extracted, {stats.hits} reused")
+
+
 def main():
 
     dataset_path = Path("data") / "raw" / "Test_AI_Human.csv"
     output_dir = Path("src") / "models"
+    feature_cache_dir = Path("data") / "feature_cache"
+    metrics_store_dir = Path("data") / "metrics_store"
+
+    warm_feature_cache(dataset_path, feature_cache_dir, metrics_store_dir)
 
     results = Parallel(
         n_jobs=3,
@@ -21,7 +43,9 @@ def main():
         delayed(train_single_model)(
             config,
             dataset_path,
-            output_dir
+            output_dir,
+            feature_cache_dir,
+            metrics_store_dir
         )
         for config in MODEL_CONFIGS
     )
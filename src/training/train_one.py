@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from src.features.feature_cache import FeatureCache
+from src.features.metrics_store import MetricsStore
 from src.model_impl.mixin import BaseModelMixin
 from src.training.model_configs import ModelConfig
 
@@ -8,11 +10,20 @@ def train_single_model(
     config: ModelConfig,
     dataset_path: Path,
     output_dir: Path,
+    feature_cache_dir: Path | None = None,
+    metrics_store_dir: Path | None = None,
 ):
     model: BaseModelMixin = config.model_cls()
     model.init_model(**config.init_kwargs)
 
-    performance = model.train(dataset=dataset_path)
+    feature_cache = FeatureCache(feature_cache_dir) if feature_cache_dir is not None else None
+    metrics_store = MetricsStore(metrics_store_dir) if metrics_store_dir is not None else None
+
+    performance = model.train(
+        dataset=dataset_path,
+        feature_cache=feature_cache,
+        metrics_store=metrics_store
+    )
 
     model_path = output_dir / f"{config.name}.pkl"
     model.save(model_path)
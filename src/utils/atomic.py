@@ -0,0 +1,21 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+
+def write_directory_atomic(entry: Path, write: Callable[[Path], None]) -> None:
+    """Fills a temporary sibling directory and renames it to entry, so readers never see a partial entry"""
+    entry.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp = Path(tempfile.mkdtemp(dir=entry.parent, prefix=".tmp-"))
+    try:
+        write(tmp)
+        os.rename(tmp, entry)
+    except OSError:
+        # Another process stored the same entry first
+        if not entry.is_dir():
+            raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
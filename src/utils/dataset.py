@@ -0,0 +1,40 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd
+from pandas import DataFrame
+
+from src.config.config import config
+
+
+def iter_dataset_chunks(
+    dataset: Path,
+    text_col: str = "text",
+    generated_col: str = "generated",
+    chunk_size: int | None = None,
+) -> Iterator[DataFrame]:
+    """Yields cleaned (text, label) chunks of a CSV dataset without reading the whole file at once"""
+    reader = pd.read_csv(
+        dataset,
+        usecols=[text_col, generated_col],
+        dtype={text_col: object, generated_col: "float32"},
+        chunksize=chunk_size or config.training.DATASET_CHUNK_SIZE,
+    )
+
+    with reader:
+        for chunk in reader:
+            chunk = chunk.dropna(subset=[text_col, generated_col])
+            chunk[generated_col] = chunk[generated_col].astype("int8")
+
+            yield chunk
+
+
+def load_dataset(
+    dataset: Path,
+    text_col: str = "text",
+    generated_col: str = "generated",
+    chunk_size: int | None = None,
+) -> DataFrame:
+    chunks = iter_dataset_chunks(dataset, text_col, generated_col, chunk_size)
+
+    return pd.concat(chunks, ignore_index=True)